@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import tempfile
 from pathlib import Path
@@ -68,7 +69,7 @@ async def create_media_job(
     temp_dir = Path(tempfile.mkdtemp(prefix="media_upload_"))
     try:
         dest = temp_dir / _sanitize_filename(file.filename or "upload")
-        _copy_upload_within_limit(file, dest, _MEDIA_MAX_UPLOAD_BYTES)
+        await asyncio.to_thread(_copy_upload_within_limit, file, dest, _MEDIA_MAX_UPLOAD_BYTES)
         await file.close()
 
         job = media_job_manager.create_job(
@@ -79,11 +79,19 @@ _term_db = TermDB()
 router = APIRouter()
 job_manager = JobManager()
 
+_UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
 
 def _sanitize_filename(name: str) -> str:
     return Path(name).name or "upload"
 
 
+def _copy_upload(upload: UploadFile, dest: Path) -> None:
+    """Stream an upload to disk in 1 MB chunks (blocking; call via asyncio.to_thread)."""
+    with dest.open("wb") as f:
+        shutil.copyfileobj(upload.file, f, _UPLOAD_CHUNK_SIZE)
+
+
 @router.get("/health")
 def health() -> dict:
     return {"status": "ok"}
@@ -97,6 +105,7 @@ def get_metrics_endpoint() -> MetricsResponse:
 
 @router.get("/models", response_model=ModelsResponse)
 def models() -> ModelsResponse:
+    # list_ollama_models keeps a short per-node TTL cache of /api/tags.
     return ModelsResponse(models=list_ollama_models())
 
 
@@ -247,13 +256,17 @@ async def create_job(
                 ),
             )
 
-    temp_dir = Path(tempfile.mkdtemp(prefix="translate_upload_"))
+    # Stage uploads on the JOBS_DIR filesystem so create_job can take them over
+    # with a rename; the staging dir is then empty and cheap to remove. A
+    # staging dir orphaned by a crash is swept by JobManager's startup cleanup.
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+    temp_dir = Path(tempfile.mkdtemp(prefix="translate_upload_", dir=JOBS_DIR))
     stored_files: List[Path] = []
     try:
         for upload in files:
             dest = temp_dir / _sanitize_filename(upload.filename or "upload")
-            with dest.open("wb") as f:
-                shutil.copyfileobj(upload.file, f)
+            # Disk I/O runs off the event loop so concurrent requests keep being served.
+            await asyncio.to_thread(_copy_upload, upload, dest)
             stored_files.append(dest)
             await upload.close()
 
@@ -269,6 +282,7 @@ async def create_job(
             enable_term_extraction=enable_term_extraction,
             output_mode=output_mode.value,
             api_key_override=api_key_override,
+            take_ownership=True,
         )
         return JobCreateResponse(job_id=job.job_id)
     finally:
@@ -661,9 +675,21 @@ def download(job_id: str):
     with job.lock:
         output_zip = job.output_zip
 
-    if not output_zip or not output_zip.exists():
+    # One stat() both checks existence and is handed to FileResponse, which
+    # would otherwise stat again. Starlette serves Range requests (resumable
+    # downloads) and advertises Accept-Ranges itself.
+    try:
+        stat_result = output_zip.stat() if output_zip else None
+    except OSError:
+        stat_result = None
+    if stat_result is None:
         raise HTTPException(status_code=404, detail="Output not ready")
-    return FileResponse(output_zip, filename=f"{job_id}.zip")
+    return FileResponse(
+        output_zip,
+        filename=f"{job_id}.zip",
+        stat_result=stat_result,
+        headers={"Cache-Control": "no-transform"},
+    )
 
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OutputMode(str, Enum):
@@ -17,10 +17,17 @@ class OutputMode(str, Enum):
 
 
 class JobCreateResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     job_id: str
 
 
 class JobStatus(BaseModel):
+    # Built field-by-field on every status poll and never mutated: frozen makes
+    # instances safe to reuse for an unchanged job, and extra="forbid" turns a
+    # misspelt field in job_status() into an error instead of a dropped key.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     job_id: str
     status: str
     processed_files: int
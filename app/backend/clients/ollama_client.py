@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import random
 import re
 import threading
 import time
-from typing import Callable, ClassVar, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    # orjson encodes/decodes in C and emits UTF-8 bytes directly, which matters
+    # for multi-KB batch prompts and per-token stream lines. Optional: fall
+    # back to the stdlib encoder where no wheel is available.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
+
 from app.backend.config import (
     API_ATTEMPTS,
     API_BACKOFF_BASE,
+    API_BACKOFF_CAP,
     BATCH_SEPARATOR,
     DEFAULT_MAX_BATCH_CHARS,
     DEFAULT_MODEL,
@@ -24,10 +36,211 @@ from app.backend.config import (
     MODEL_TYPE_OPTIONS,
     ModelType,
     OLLAMA_BASE_URL,
+    OLLAMA_CIRCUIT_FAILURE_THRESHOLD,
+    OLLAMA_CIRCUIT_RECOVERY_S,
+    OLLAMA_FALLBACK_URLS,
     TimeoutConfig,
 )
 from app.backend.utils.logging_utils import logger
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Decorrelated-jitter retry backoff: each wait is drawn from
+# [API_BACKOFF_BASE, 3 * previous wait], capped. Randomized waits keep
+# concurrent workers from retrying in lock-step against a recovering server.
+
+
+def _next_backoff(prev: float) -> float:
+    """Return the next retry wait given the previous one (0.0 on first retry)."""
+    upper = min(API_BACKOFF_CAP, max(prev, API_BACKOFF_BASE) * 3)
+    return random.uniform(API_BACKOFF_BASE, upper)
+
+
+_CIRCUIT_OPEN = "[circuit open]"
+
+# Pooled sockets reserved beyond HTTP_POOL_MAXSIZE for non-generate calls.
+_CONTROL_POOL_HEADROOM = 2
+
+# Error substrings that mean the prompt was too large for the model's context.
+_CONTEXT_ERROR_KEYWORDS = ("context", "length", "memory", "too long", "exceeded")
+
+# Adaptive batch sizing: translate_batch splits inputs above a per-client
+# character target that shrinks on oversized/garbled batches and creeps back
+# toward DEFAULT_MAX_BATCH_CHARS on success.
+_MIN_TARGET_BATCH_CHARS = 500
+_BATCH_SHRINK = 0.75
+_BATCH_GROW = 1.1
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_dumps(obj: object) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the
+# stdlib exception either way.
+_json_loads = _orjson.loads if _orjson is not None else json.loads
+
+# Hot-path patterns, compiled once at import.
+_SEG_MARKER_RE = re.compile(r"<<<SEG_\d+>>>\s*")
+_SENT_RE = re.compile(r"(?<=[.!?。！？])\s+")
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_MD_EMPHASIS_RE = re.compile(r"\*{1,2}(.+?)\*{1,2}")
+_ARTEFACT_RE = re.compile(r"<<<?\/?(?:SEP|END|SEG_\d+)>>>?")
+_XML_TAG_RE = re.compile(r"</?[A-Z][A-Z0-9_]*(?:\s[^>]*)?>")
+_COMMENTARY_RE = re.compile(
+    r'^(?:'
+    r'(?:Final decision|Note|Output|Translation|Explanation|Answer|Result|Remark|Comment)'
+    r'\s*[:：]'
+    r'|→\s'
+    r'|\(Note[:：]'
+    r'|\((?:người|Revision|Version|Name|Date|Release|New Issue)[^)]*\)\s*$'
+    r')',
+    re.IGNORECASE,
+)
+
+
+_SEG_OPEN = "<<<SEG_"
+_SEG_CLOSE = ">>>"
+
+
+def _split_segments(response: str) -> List[Tuple[int, str]]:
+    """Return (index, text) for each <<<SEG_N>>> marker in response.
+
+    Linear str.find scan: each segment runs to the next "<<<SEG_" (well-formed
+    or not) or the end of the response, and malformed markers are skipped.
+    """
+    out: List[Tuple[int, str]] = []
+    start = response.find(_SEG_OPEN)
+    while start != -1:
+        digits_at = start + len(_SEG_OPEN)
+        close = response.find(_SEG_CLOSE, digits_at)
+        nxt = response.find(_SEG_OPEN, digits_at)
+        digits = response[digits_at:close] if close != -1 else ""
+        if digits.isdecimal() and (nxt == -1 or close < nxt):
+            end = nxt if nxt != -1 else len(response)
+            out.append((int(digits), response[close + len(_SEG_CLOSE):end].strip()))
+        start = nxt
+    return out
+
+
+class _CircuitBreaker:
+    """Per-endpoint circuit breaker (CLOSED -> OPEN -> HALF_OPEN).
+
+    Opens after ``failure_threshold`` consecutive failures so an unreachable
+    Ollama costs a lock acquire instead of connect/read timeouts plus retry
+    sleeps. Once ``recovery_timeout`` has passed a single trial request is let
+    through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float) -> None:
+        self._failure_threshold = max(failure_threshold, 1)
+        self._recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._trial_in_flight or time.monotonic() - self._opened_at >= self._recovery_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self._recovery_timeout:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self._failure_threshold:
+                if self._opened_at is None or self._trial_in_flight:
+                    logger.warning("[OLLAMA] circuit open after %d consecutive failures", self._failures)
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class _EndpointStats:
+    """Recent latency, in-flight count and concurrency limit for one Ollama endpoint.
+
+    Latency is an EWMA of time-to-first-byte, which on Ollama is dominated by
+    queueing plus prompt evaluation and so tracks how loaded the node is.
+
+    The concurrency limit is AIMD-controlled between 1 and max_limit: a
+    failed request (connection error, 5xx, dropped stream) halves it, and a
+    limit's worth of consecutive successes raises it by one. acquire() blocks
+    while the endpoint is at its limit, so a struggling server sees its
+    queue drain instead of a burst of retries.
+    """
+
+    _ALPHA = 0.3
+
+    def __init__(self, max_limit: int = HTTP_POOL_MAXSIZE) -> None:
+        self._lock = threading.Lock()
+        self._slot_free = threading.Condition(self._lock)
+        self.ewma_s = 0.0
+        self.in_flight = 0
+        self._max_limit = max(max_limit, 1)
+        self.limit = self._max_limit
+        self._successes = 0
+
+    def score(self) -> Tuple[float, int]:
+        # An unmeasured endpoint scores 0.0 so it is probed before the others.
+        with self._lock:
+            return self.ewma_s * (self.in_flight + 1), self.in_flight
+
+    def acquire(self) -> None:
+        with self._slot_free:
+            while self.in_flight >= self.limit:
+                self._slot_free.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        with self._slot_free:
+            self.in_flight -= 1
+            self._slot_free.notify()
+
+    def observe(self, elapsed_s: float) -> None:
+        with self._lock:
+            if self.ewma_s == 0.0:
+                self.ewma_s = elapsed_s
+            else:
+                self.ewma_s += self._ALPHA * (elapsed_s - self.ewma_s)
+
+    def record_outcome(self, ok: bool) -> None:
+        with self._slot_free:
+            if not ok:
+                self._successes = 0
+                if self.limit > 1:
+                    self.limit = max(1, self.limit // 2)
+                    logger.info("[OLLAMA] concurrency limit reduced to %d", self.limit)
+                return
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self._max_limit:
+                self.limit += 1
+                self._successes = 0
+                self._slot_free.notify()
+
 
 # Common CJK "none / N-A" single-token values that small models tend to over-translate.
 # Mapped to a concise target-language equivalent to bypass the LLM entirely.
@@ -89,11 +302,165 @@ def _drop_english_preamble(lines: list[str]) -> list[str]:
     return lines
 
 
+def _chunk_text(text: str, max_chars: int) -> Tuple[List[str], str]:
+    """Split long text for chunked translation; returns (chunks, joiner).
+
+    Splits at the coarsest boundary present (paragraph, then line, then
+    sentence). Sentences carry no layout, so they are packed greedily up to
+    max_chars instead of costing one request each. Any piece still over the
+    limit is cut at its last space before the limit (hard cut only for
+    unspaced scripts such as CJK).
+    """
+    if "\n\n" in text:
+        pieces, joiner = text.split("\n\n"), "\n\n"
+    elif "\n" in text:
+        pieces, joiner = text.split("\n"), "\n"
+    else:
+        pieces, joiner = _SENT_RE.split(text), " "
+
+    chunks: List[str] = []
+    pending = ""
+    for raw in pieces:
+        piece = raw.strip()
+        if not piece:
+            continue
+        if joiner == " ":
+            if pending and len(pending) + 1 + len(piece) <= max_chars:
+                pending = f"{pending} {piece}"
+                continue
+            if pending:
+                chunks.append(pending)
+                pending = ""
+        start = 0
+        while len(piece) - start > max_chars:
+            cut = piece.rfind(" ", start + 1, start + max_chars + 1)
+            if cut == -1:
+                cut = start + max_chars
+            chunks.append(piece[start:cut].rstrip())
+            start = cut
+            while start < len(piece) and piece[start].isspace():
+                start += 1
+        tail = piece[start:]
+        if joiner == " ":
+            pending = tail
+        elif tail:
+            chunks.append(tail)
+    if pending:
+        chunks.append(pending)
+    return chunks, joiner
+
+
+def _pack_chunks(chunks: List[str], max_chars: int) -> List[List[str]]:
+    """Group consecutive chunks greedily so each group's text fits max_chars."""
+    groups: List[List[str]] = []
+    size = 0
+    for chunk in chunks:
+        if groups and size + len(chunk) <= max_chars:
+            groups[-1].append(chunk)
+            size += len(chunk)
+        else:
+            groups.append([chunk])
+            size = len(chunk)
+    return groups
+
+
+def _map_concurrent(fn: Callable[[T], R], items: List[T]) -> List[R]:
+    """Map fn over items on up to HTTP_POOL_MAXSIZE threads, preserving order."""
+    workers = max(1, min(HTTP_POOL_MAXSIZE, len(items)))
+    if workers == 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ollama-chunk") as pool:
+        return list(pool.map(fn, items))
+
+
+_TRANSLATEGEMMA_BATCH_SUFFIX = (
+    "\n\nOutput format (keep all markers):\n"
+    "<<<SEG_0>>>\n[translation of segment 0]\n"
+    "<<<SEG_1>>>\n[translation of segment 1]\n..."
+)
+_BATCH_USER_SUFFIX = (
+    "\n\nOutput format:\n"
+    "<<<SEG_0>>>\n[translation]\n"
+    "<<<SEG_1>>>\n[translation]\n..."
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _prompt_prefix(variant: str, source_language: Optional[str], target_language: str) -> str:
+    """Everything in a prompt before its text payload, built once per (variant, pair).
+
+    Bulk jobs format the same boilerplate for every segment; with the prefix
+    cached, each prompt costs one concatenation.
+    """
+    if variant in ("translategemma", "translategemma_batch"):
+        src_lang = OllamaClient._normalize_source_language(source_language)
+        tgt_name, tgt_code = LANG_CODE_MAP.get(target_language, (target_language, target_language.lower()[:2]))
+        src_name, src_code = LANG_CODE_MAP.get(src_lang, (src_lang, src_lang.lower()[:2]))
+        intro = (
+            f"You are a professional {src_name} ({src_code}) to {tgt_name} ({tgt_code}) translator. "
+            f"Your goal is to accurately convey the meaning and nuances of the original {src_name} text "
+            f"while adhering to {tgt_name} grammar, vocabulary, and cultural sensitivities."
+        )
+        if variant == "translategemma":
+            return (
+                f"{intro} Produce only the {tgt_name} translation, without any additional explanations or commentary. "
+                f"Please translate the following {src_name} text into {tgt_name}:\n\n"
+            )
+        return (
+            f"{intro}\n\n"
+            "IMPORTANT: Translate each numbered segment below. Keep the <<<SEG_N>>> markers in your output.\n\n"
+        )
+    if variant == "generic":
+        source = OllamaClient._normalize_source_language(source_language)
+        return (
+            f"Task: Translate ONLY into {target_language} from {source}.\n"
+            f"Rules:\n"
+            f"1) Output translation text ONLY (no source text, no notes, no questions, no language-detection remarks).\n"
+            f"2) Preserve original line breaks.\n"
+            f"3) Do NOT wrap in quotes or code blocks.\n\n"
+        )
+    if variant == "dedicated":
+        if OllamaClient._involves_chinese(target_language, source_language):
+            return f"将以下文本翻译为{target_language}，注意只需要输出翻译后的结果，不要额外解释：\n\n"
+        return f"Translate the following segment into {target_language}. Prefer natural, idiomatic phrasing over literal translation. Output only the translation.\n\n"
+    if OllamaClient._is_auto_source(source_language):
+        direction = f"Translate to {target_language}:"
+    else:
+        direction = f"Translate from {source_language} to {target_language}:"
+    if variant == "user":
+        return f"{direction}\n\n"
+    if variant == "batch_user":
+        return (
+            f"{direction}\n"
+            "Translate each segment and keep every <<<SEG_N>>> marker exactly as-is.\n"
+            "Output only translated text in the same marker order.\n\n"
+        )
+    raise ValueError(f"unknown prompt variant: {variant!r}")
+
+
+_PRIMARY_BATCH_SEPARATOR = BATCH_SEPARATOR.strip()
+# Fallback separators tried in order; the primary separator is not repeated.
+_ALT_BATCH_SEPARATORS = tuple(
+    sep for sep in ("---SEGMENT_SEPARATOR---", "\n---\n", "\n\n---\n\n", "---")
+    if sep != _PRIMARY_BATCH_SEPARATOR
+)
+
+
+def _split_nonempty(response: str, sep: str) -> List[str]:
+    return [part for part in (p.strip() for p in response.split(sep)) if part]
+
+
+def _seg_marked(texts: List[str]) -> str:
+    return "\n".join(f"<<<SEG_{i}>>>\n{text}" for i, text in enumerate(texts))
+
+
 class OllamaClient:
     """Ollama API client for local translation services with connection pooling."""
 
     _session: ClassVar[Optional[requests.Session]] = None
     _session_lock: ClassVar[threading.Lock] = threading.Lock()
+    _breakers: ClassVar[Dict[str, _CircuitBreaker]] = {}
+    _endpoint_stats: ClassVar[Dict[str, _EndpointStats]] = {}
 
     def __init__(
         self,
@@ -105,10 +472,20 @@ class OllamaClient:
         num_ctx_override: Optional[int] = None,
         timeout: Optional[TimeoutConfig] = None,
         log: Callable[[str], None] = lambda s: None,
+        fallback_urls: Optional[Sequence[str]] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        # Generate calls are routed across base_url plus these nodes; health
+        # and model listing accept any live node, and unload reaches all of them.
+        extra = OLLAMA_FALLBACK_URLS if fallback_urls is None else fallback_urls
+        self._endpoints: Tuple[str, ...] = tuple(dict.fromkeys([self.base_url, *(u.rstrip("/") for u in extra)]))
+        self._generate_urls: Dict[str, str] = {e: f"{e}/api/generate" for e in self._endpoints}
+        self._tags_urls: Dict[str, str] = {e: f"{e}/api/tags" for e in self._endpoints}
         self.model = model
-        self.model_type = self._normalize_model_type(model_type).value
+        model_type_enum = self._normalize_model_type(model_type)
+        self.model_type = model_type_enum.value
+        # Resolved once: model_type is fixed for the client's lifetime.
+        self._options_template = MODEL_TYPE_OPTIONS.get(model_type_enum, MODEL_TYPE_OPTIONS[ModelType.GENERAL])
         self.system_prompt = (system_prompt or "").strip()
         self.profile_id = (profile_id or "").strip() or None
         self._num_ctx_override = num_ctx_override if (num_ctx_override is not None and num_ctx_override > 0) else None
@@ -116,6 +493,10 @@ class OllamaClient:
         self._cache_variant: Optional[str] = None
         self.timeout = timeout or TimeoutConfig()
         self.log = log
+        self._bound_session: Optional[requests.Session] = None
+        self._target_batch_chars = float(DEFAULT_MAX_BATCH_CHARS)
+        # Sub-batches and per-segment fallbacks run on _map_concurrent threads.
+        self._batch_target_lock = threading.Lock()
         options = self._build_options()
         logger.info(
             "[CONFIG] Ollama options: model_type=%s, options=%s, num_ctx_override=%s, max_batch_chars=%d",
@@ -125,6 +506,17 @@ class OllamaClient:
             DEFAULT_MAX_BATCH_CHARS,
         )
 
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @model.setter
+    def model(self, value: str) -> None:
+        # Callers swap models on a live client (e.g. term extraction), so the
+        # model-family flag is derived here rather than once in __init__.
+        self._model = value
+        self._is_translategemma = "translategemma" in value.lower()
+
     @classmethod
     def _get_session(cls) -> requests.Session:
         """Get or create shared session with connection pooling."""
@@ -132,26 +524,46 @@ class OllamaClient:
             with cls._session_lock:
                 if cls._session is None:
                     session = requests.Session()
+                    # No urllib3 backoff: the translate_* loops already sleep
+                    # with jitter; stacking both would only delay endpoint
+                    # fail-over and the circuit breaker.
                     retry_strategy = Retry(
                         total=3,
-                        backoff_factor=0.5,
+                        backoff_factor=0,
                         status_forcelist=[500, 502, 503, 504],
                     )
+                    # pool_block: a caller beyond pool_maxsize waits for a
+                    # pooled socket instead of opening a throwaway one.
+                    # Generate streams are already capped at HTTP_POOL_MAXSIZE
+                    # per endpoint (_EndpointStats), so the extra slots keep
+                    # /api/tags and unload calls from queueing behind them.
+                    # One host pool per configured Ollama node.
+                    pool_connections = max(HTTP_POOL_CONNECTIONS, 1 + len(OLLAMA_FALLBACK_URLS))
+                    pool_maxsize = HTTP_POOL_MAXSIZE + _CONTROL_POOL_HEADROOM
                     adapter = HTTPAdapter(
-                        pool_connections=HTTP_POOL_CONNECTIONS,
-                        pool_maxsize=HTTP_POOL_MAXSIZE,
+                        pool_connections=pool_connections,
+                        pool_maxsize=pool_maxsize,
                         max_retries=retry_strategy,
+                        pool_block=True,
                     )
                     session.mount("http://", adapter)
                     session.mount("https://", adapter)
                     cls._session = session
                     logger.debug(
                         "Created HTTP session with pool_connections=%d, pool_maxsize=%d",
-                        HTTP_POOL_CONNECTIONS,
-                        HTTP_POOL_MAXSIZE,
+                        pool_connections,
+                        pool_maxsize,
                     )
         return cls._session
 
+    @property
+    def session(self) -> requests.Session:
+        """The shared session, bound on first use to skip the class-level lookup."""
+        session = self._bound_session
+        if session is None:
+            session = self._bound_session = self._get_session()
+        return session
+
     @classmethod
     def close_session(cls) -> None:
         """Close the shared session and release connections."""
@@ -161,6 +573,32 @@ class OllamaClient:
                 cls._session = None
                 logger.debug("Closed HTTP session")
 
+    @classmethod
+    def _get_breaker(cls, base_url: str) -> _CircuitBreaker:
+        """Get or create the process-wide circuit breaker for an endpoint."""
+        breaker = cls._breakers.get(base_url)
+        if breaker is None:
+            with cls._session_lock:
+                breaker = cls._breakers.setdefault(
+                    base_url,
+                    _CircuitBreaker(OLLAMA_CIRCUIT_FAILURE_THRESHOLD, OLLAMA_CIRCUIT_RECOVERY_S),
+                )
+        return breaker
+
+    @classmethod
+    def _get_endpoint_stats(cls, base_url: str) -> _EndpointStats:
+        stats = cls._endpoint_stats.get(base_url)
+        if stats is None:
+            with cls._session_lock:
+                stats = cls._endpoint_stats.setdefault(base_url, _EndpointStats())
+        return stats
+
+    def _ranked_endpoints(self) -> Tuple[str, ...]:
+        """Endpoints ordered by load score; ties keep configured order."""
+        if len(self._endpoints) == 1:
+            return self._endpoints
+        return tuple(sorted(self._endpoints, key=lambda u: self._get_endpoint_stats(u).score()))
+
     def _gen_url(self, path: str) -> str:
         return f"{self.base_url}{path}"
 
@@ -175,9 +613,7 @@ class OllamaClient:
             return ModelType.GENERAL
 
     def _build_options(self) -> Dict[str, object]:
-        model_type_enum = self._normalize_model_type(self.model_type)
-        options_template = MODEL_TYPE_OPTIONS.get(model_type_enum, MODEL_TYPE_OPTIONS[ModelType.GENERAL])
-        options = dict(options_template)
+        options = dict(self._options_template)
         if self._num_ctx_override is not None:
             options["num_ctx"] = self._num_ctx_override
         if self._runtime_options_override:
@@ -227,7 +663,7 @@ class OllamaClient:
         return {"model": self.model, "prompt": prompt, "options": self._build_options(), "think": False}
 
     def _is_translategemma_model(self) -> bool:
-        return "translategemma" in self.model.lower()
+        return self._is_translategemma
 
     @staticmethod
     def _normalize_source_language(source_language: Optional[str]) -> str:
@@ -249,7 +685,7 @@ class OllamaClient:
         not the max wait for the entire response. As long as Ollama keeps
         producing tokens, it won't timeout.
         """
-        session = self._get_session()
+        session = self.session
         send_payload = {**payload, "stream": True}
         timeout = timeout_tuple or self.timeout.get_timeout_tuple()
 
@@ -267,13 +703,62 @@ class OllamaClient:
             "..." if len(str(payload.get("prompt", ""))) > 200 else "",
         )
 
-        t0 = time.time()
-        resp = session.post(
-            self._gen_url("/api/generate"),
-            json=send_payload, stream=True, timeout=timeout,
-        )
+        resp = None
+        last_exc: Optional[BaseException] = None
+        for endpoint in self._ranked_endpoints():
+            breaker = self._get_breaker(endpoint)
+            if not breaker.allow():
+                continue
+            stats = self._get_endpoint_stats(endpoint)
+            stats.acquire()
+            t0 = time.time()
+            try:
+                resp = session.post(
+                    self._generate_urls[endpoint],
+                    data=_json_dumps(send_payload), headers=_JSON_HEADERS,
+                    stream=True, timeout=timeout,
+                )
+            except requests.exceptions.RequestException as exc:
+                stats.release()
+                breaker.record_failure()
+                stats.record_outcome(False)
+                last_exc = exc
+                if len(self._endpoints) > 1:
+                    logger.warning("[OLLAMA] %s unreachable (%s); trying next endpoint", endpoint, exc)
+                continue
+            except BaseException:
+                stats.release()
+                breaker.record_failure()
+                stats.record_outcome(False)
+                raise
+            stats.observe(time.time() - t0)
+            break
+
+        if resp is None:
+            if last_exc is not None:
+                raise last_exc
+            return False, f"{_CIRCUIT_OPEN} Ollama at {', '.join(self._endpoints)} is failing; request skipped"
+
+        def _report(healthy: bool) -> None:
+            if healthy:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            stats.record_outcome(healthy)
 
+        try:
+            return self._read_generate_stream(resp, _report, t0)
+        finally:
+            stats.release()
+
+    @staticmethod
+    def _read_generate_stream(
+        resp: requests.Response, report: Callable[[bool], None], t0: float,
+    ) -> Tuple[bool, str]:
+        """Drain a streamed /api/generate response, reporting endpoint health via report()."""
         if resp.status_code != 200:
+            # 4xx (e.g. unknown model) means the server itself is healthy.
+            report(resp.status_code < 500)
             error_text = ""
             try:
                 error_text = resp.text[:180]
@@ -286,21 +771,27 @@ class OllamaClient:
 
         try:
             parts: list[str] = []
-            for line in resp.iter_lines():
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                token = data.get("response", "")
-                if token:
-                    parts.append(token)
-                if data.get("done", False):
-                    break
+            try:
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = _json_loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    token = data.get("response", "")
+                    if token:
+                        parts.append(token)
+                    if data.get("done", False):
+                        break
+            except BaseException:
+                # Mid-stream read timeout / dropped connection.
+                report(False)
+                raise
+            report(True)
             raw_result = "".join(parts).strip()
             # Strip <think>...</think> blocks from Qwen3.5 thinking mode output
-            result = re.sub(r"<think>.*?</think>", "", raw_result, flags=re.DOTALL).strip()
+            result = _THINK_RE.sub("", raw_result).strip()
             if raw_result and not result:
                 logger.warning("[OLLAMA_RES] Model returned only <think> content (%d chars), no translation", len(raw_result))
             elapsed = time.time() - t0
@@ -314,42 +805,36 @@ class OllamaClient:
         finally:
             resp.close()
 
+    def _live_endpoints(self) -> Tuple[str, ...]:
+        """Ranked endpoints whose circuit is not open (a half-open one may be probed)."""
+        return tuple(e for e in self._ranked_endpoints() if self._get_breaker(e).state != "open")
+
     def health_check(self) -> Tuple[bool, str]:
-        try:
-            session = self._get_session()
-            resp = session.get(self._gen_url("/api/tags"), timeout=self.timeout.get_timeout_tuple())
-            if resp.status_code == 200:
-                names = [m.get("name", "") for m in (resp.json().get("models") or []) if isinstance(m, dict)]
-                preview = ", ".join(names[:6]) + ("..." if len(names) > 6 else "")
-                return True, f"OK; models={preview}"
-            return False, f"HTTP {resp.status_code}: {resp.text[:180]}"
-        except requests.exceptions.RequestException as exc:
-            return False, f"Request error: {exc}"
+        """Healthy if any endpoint whose circuit is not open answers /api/tags."""
+        errors: List[str] = []
+        for endpoint in self._live_endpoints():
+            try:
+                resp = self.session.get(self._tags_urls[endpoint], timeout=self.timeout.get_timeout_tuple())
+                if resp.status_code == 200:
+                    names = [m.get("name", "") for m in (_json_loads(resp.content).get("models") or []) if isinstance(m, dict)]
+                    preview = ", ".join(names[:6]) + ("..." if len(names) > 6 else "")
+                    via = "" if endpoint == self.base_url else f" via {endpoint}"
+                    return True, f"OK{via}; models={preview}"
+                error = f"HTTP {resp.status_code}: {resp.text[:180]}"
+            except requests.exceptions.RequestException as exc:
+                error = f"Request error: {exc}"
+            errors.append(error if len(self._endpoints) == 1 else f"{endpoint}: {error}")
+        if not errors:
+            return False, f"{_CIRCUIT_OPEN} Ollama at {', '.join(self._endpoints)} is failing"
+        return False, "; ".join(errors)
 
     @staticmethod
     def _build_translategemma_prompt(text: str, target_language: str, source_language: Optional[str]) -> str:
-        tgt_name, tgt_code = LANG_CODE_MAP.get(target_language, (target_language, target_language.lower()[:2]))
-        src_lang = OllamaClient._normalize_source_language(source_language)
-        src_name, src_code = LANG_CODE_MAP.get(src_lang, (src_lang, src_lang.lower()[:2]))
-        return (
-            f"You are a professional {src_name} ({src_code}) to {tgt_name} ({tgt_code}) translator. "
-            f"Your goal is to accurately convey the meaning and nuances of the original {src_name} text "
-            f"while adhering to {tgt_name} grammar, vocabulary, and cultural sensitivities. "
-            f"Produce only the {tgt_name} translation, without any additional explanations or commentary. "
-            f"Please translate the following {src_name} text into {tgt_name}:\n\n{text}"
-        )
+        return _prompt_prefix("translategemma", source_language, target_language) + text
 
     @staticmethod
     def _build_generic_prompt(text: str, target_language: str, source_language: Optional[str]) -> str:
-        source = OllamaClient._normalize_source_language(source_language)
-        return (
-            f"Task: Translate ONLY into {target_language} from {source}.\n"
-            f"Rules:\n"
-            f"1) Output translation text ONLY (no source text, no notes, no questions, no language-detection remarks).\n"
-            f"2) Preserve original line breaks.\n"
-            f"3) Do NOT wrap in quotes or code blocks.\n\n"
-            f"{text}"
-        )
+        return _prompt_prefix("generic", source_language, target_language) + text
 
     @staticmethod
     def _involves_chinese(target_language: str, source_language: Optional[str] = None) -> bool:
@@ -365,35 +850,15 @@ class OllamaClient:
     def _build_translation_dedicated_prompt(
         text: str, target_language: str, source_language: Optional[str] = None,
     ) -> str:
-        if OllamaClient._involves_chinese(target_language, source_language):
-            return f"将以下文本翻译为{target_language}，注意只需要输出翻译后的结果，不要额外解释：\n\n{text}"
-        return f"Translate the following segment into {target_language}. Prefer natural, idiomatic phrasing over literal translation. Output only the translation.\n\n{text}"
+        return _prompt_prefix("dedicated", source_language, target_language) + text
 
     @staticmethod
     def _build_user_prompt(text: str, target_language: str, source_language: Optional[str]) -> str:
-        if OllamaClient._is_auto_source(source_language):
-            direction = f"Translate to {target_language}:"
-        else:
-            direction = f"Translate from {source_language} to {target_language}:"
-        return f"{direction}\n\n{text}"
+        return _prompt_prefix("user", source_language, target_language) + text
 
     @staticmethod
     def _build_batch_user_prompt(texts: List[str], target_language: str, source_language: Optional[str]) -> str:
-        segments = [f"<<<SEG_{i}>>>\n{text}" for i, text in enumerate(texts)]
-        combined_text = "\n".join(segments)
-        if OllamaClient._is_auto_source(source_language):
-            direction = f"Translate to {target_language}:"
-        else:
-            direction = f"Translate from {source_language} to {target_language}:"
-        return (
-            f"{direction}\n"
-            "Translate each segment and keep every <<<SEG_N>>> marker exactly as-is.\n"
-            "Output only translated text in the same marker order.\n\n"
-            f"{combined_text}\n\n"
-            "Output format:\n"
-            "<<<SEG_0>>>\n[translation]\n"
-            "<<<SEG_1>>>\n[translation]\n..."
-        )
+        return _prompt_prefix("batch_user", source_language, target_language) + _seg_marked(texts) + _BATCH_USER_SUFFIX
 
     def _build_single_translate_payload(self, text: str, tgt: str, src_lang: Optional[str]) -> Dict[str, object]:
         if self._is_translation_dedicated():
@@ -465,6 +930,7 @@ class OllamaClient:
             )
             payload["system"] = merged_system
         last = None
+        delay = 0.0
         for attempt in range(1, API_ATTEMPTS + 1):
             try:
                 ok, result = self._call_ollama(payload)
@@ -481,9 +947,13 @@ class OllamaClient:
                         return True, src_stripped  # passthrough: original is better than hallucination
                     return True, sanitized
                 last = result
+                if result.startswith(_CIRCUIT_OPEN):
+                    return False, result
             except requests.exceptions.RequestException as exc:
                 last = f"Request error: {exc}"
-            time.sleep(API_BACKOFF_BASE * attempt)
+            if attempt < API_ATTEMPTS:
+                delay = _next_backoff(delay)
+                time.sleep(delay)
 
         # Smart retry: detect error type and apply appropriate strategy
         return self._smart_retry(text, tgt, src_lang, str(last))
@@ -525,15 +995,20 @@ class OllamaClient:
         prompt = self._build_merged_prompt(merged_text, segment_count, tgt, src_lang)
         payload = self._build_payload(prompt)
         last = None
+        delay = 0.0
         for attempt in range(1, API_ATTEMPTS + 1):
             try:
                 ok, result = self._call_ollama(payload)
                 if ok:
                     return True, result
                 last = result
+                if result.startswith(_CIRCUIT_OPEN):
+                    break
             except requests.exceptions.RequestException as exc:
                 last = f"Request error: {exc}"
-            time.sleep(API_BACKOFF_BASE * attempt)
+            if attempt < API_ATTEMPTS:
+                delay = _next_backoff(delay)
+                time.sleep(delay)
         return False, str(last)
 
     @staticmethod
@@ -576,7 +1051,7 @@ class OllamaClient:
         error_lower = error_msg.lower()
 
         # Strategy 1: Text too long (context length, memory issues)
-        if any(kw in error_lower for kw in ["context", "length", "memory", "too long", "exceeded"]):
+        if any(kw in error_lower for kw in _CONTEXT_ERROR_KEYWORDS):
             logger.info(f"Text too long ({len(text)} chars), attempting chunked translation")
             return self._translate_chunked(text, tgt, src_lang)
 
@@ -600,48 +1075,65 @@ class OllamaClient:
         Returns:
             Tuple of (success, translated_text).
         """
-        # Try splitting by paragraphs first
-        if "\n\n" in text:
-            chunks = [chunk.strip() for chunk in text.split("\n\n") if chunk.strip()]
-            joiner = "\n\n"
-        elif "\n" in text:
-            chunks = [chunk.strip() for chunk in text.split("\n") if chunk.strip()]
-            joiner = "\n"
-        else:
-            # Split by sentences (rough approximation)
-            sentences = re.split(r'(?<=[.!?。！？])\s+', text)
-            chunks = [s.strip() for s in sentences if s.strip()]
-            joiner = " "
-
-        # Further split chunks that are still too long
-        final_chunks = []
-        for chunk in chunks:
-            if len(chunk) <= max_chunk_chars:
-                final_chunks.append(chunk)
-            else:
-                # Force split by character limit
-                for i in range(0, len(chunk), max_chunk_chars):
-                    final_chunks.append(chunk[i:i + max_chunk_chars])
+        final_chunks, joiner = _chunk_text(text, max_chunk_chars)
 
         if not final_chunks:
             return False, "[Chunked translation failed: no valid chunks]"
 
-        # Translate each chunk
-        translated_chunks = []
-        for chunk in final_chunks:
+        # Long documents repeat boilerplate paragraphs; translate each distinct
+        # chunk once. (Whole segments are already deduplicated and cached by
+        # translation_service under cache_model_key.)
+        unique_chunks = list(dict.fromkeys(final_chunks))
+        translated: Dict[str, str] = {}
+
+        # Short paragraphs/lines are coalesced into <<<SEG_N>>> batch requests
+        # of up to max_chunk_chars each, so N chunks cost a few round-trips
+        # instead of N. A group whose reply does not parse back into the same
+        # number of segments falls through to the per-chunk path below.
+        if not self._is_translation_dedicated():
+            groups = [g for g in _pack_chunks(unique_chunks, max_chunk_chars) if len(g) > 1]
+            for group, results in zip(groups, _map_concurrent(
+                lambda g: self._translate_chunk_group(g, tgt, src_lang), groups,
+            )):
+                if results is not None:
+                    translated.update(zip(group, results))
+
+        # Remaining chunks are independent requests: dispatch them concurrently
+        # over the shared session pool so latency is bounded by the slowest
+        # chunk rather than the sum (Ollama queues beyond its OLLAMA_NUM_PARALLEL slots).
+        def _translate_chunk(chunk: str) -> Tuple[bool, str]:
             payload = self._build_single_translate_payload(chunk, tgt, src_lang)
-
             try:
-                ok, result = self._call_ollama(payload)
-                if ok:
-                    translated_chunks.append(result)
-                else:
-                    return False, f"[Chunk translation failed] {result}"
+                return self._call_ollama(payload)
             except requests.exceptions.RequestException as exc:
-                return False, f"[Chunk translation failed] {exc}"
+                return False, str(exc)
+
+        pending = [chunk for chunk in unique_chunks if chunk not in translated]
+        for chunk, (ok, result) in zip(pending, _map_concurrent(_translate_chunk, pending)):
+            if not ok:
+                return False, f"[Chunk translation failed] {result}"
+            translated[chunk] = result
+
+        translated_chunks = [translated[chunk] for chunk in final_chunks]
 
         return True, joiner.join(translated_chunks)
 
+    def _translate_chunk_group(self, chunks: List[str], tgt: str, src_lang: Optional[str]) -> Optional[List[str]]:
+        """Translate chunks in one batch request; None if the reply is unusable."""
+        payload = self._build_batch_translate_payload(chunks, tgt, src_lang)
+        try:
+            ok, result = self._call_ollama(payload)
+        except requests.exceptions.RequestException:
+            return None
+        if not ok:
+            return None
+        results = self._parse_batch_response(result, len(chunks))
+        # _parse_batch_response pads unparsed segments with "": treat as a miss.
+        if len(results) != len(chunks) or not all(results):
+            logger.info("Chunk batch parse mismatch (%d segments); translating chunks individually", len(chunks))
+            return None
+        return results
+
     def _translate_with_extended_retry(self, text: str, tgt: str, src_lang: Optional[str]) -> Tuple[bool, str]:
         """Retry translation with extended wait times for temporary issues.
 
@@ -656,10 +1148,10 @@ class OllamaClient:
         payload = self._build_single_translate_payload(text, tgt, src_lang)
         extended_timeout = (self.timeout.connect_timeout, self.timeout.read_timeout * 1.5)
 
-        # Extended retry with longer waits
-        wait_times = [5, 10, 20]  # seconds
+        # Extended retry with longer, jittered waits (~5s, ~10s, ~20s)
+        wait_times = [5 * 2 ** i * random.uniform(0.5, 1.5) for i in range(3)]
         for wait_time in wait_times:
-            logger.debug(f"Extended retry: waiting {wait_time}s before attempt")
+            logger.debug(f"Extended retry: waiting {wait_time:.1f}s before attempt")
             time.sleep(wait_time)
 
             try:
@@ -697,52 +1189,57 @@ class OllamaClient:
     @staticmethod
     def _build_batch_translategemma_prompt(texts: List[str], target_language: str, source_language: Optional[str]) -> str:
         """Build batch translation prompt with numbered segment markers for better parsing."""
-        tgt_name, tgt_code = LANG_CODE_MAP.get(target_language, (target_language, target_language.lower()[:2]))
-        src_lang = OllamaClient._normalize_source_language(source_language)
-        src_name, src_code = LANG_CODE_MAP.get(src_lang, (src_lang, src_lang.lower()[:2]))
-
-        # Build segments with numbered markers
-        segments = []
-        for i, text in enumerate(texts):
-            segments.append(f"<<<SEG_{i}>>>\n{text}")
-        combined_text = "\n".join(segments)
-
         return (
-            f"You are a professional {src_name} ({src_code}) to {tgt_name} ({tgt_code}) translator. "
-            f"Your goal is to accurately convey the meaning and nuances of the original {src_name} text "
-            f"while adhering to {tgt_name} grammar, vocabulary, and cultural sensitivities.\n\n"
-            f"IMPORTANT: Translate each numbered segment below. Keep the <<<SEG_N>>> markers in your output.\n\n"
-            f"{combined_text}\n\n"
-            f"Output format (keep all markers):\n"
-            f"<<<SEG_0>>>\n[translation of segment 0]\n"
-            f"<<<SEG_1>>>\n[translation of segment 1]\n..."
+            _prompt_prefix("translategemma_batch", source_language, target_language)
+            + _seg_marked(texts)
+            + _TRANSLATEGEMMA_BATCH_SUFFIX
         )
 
     def translate_batch(self, texts: List[str], tgt: str, src_lang: Optional[str]) -> Tuple[bool, List[str]]:
+        outcomes = self.translate_batch_outcomes(texts, tgt, src_lang)
+        return all(ok for ok, _ in outcomes), [result for _, result in outcomes]
+
+    def translate_batch_outcomes(
+        self, texts: List[str], tgt: str, src_lang: Optional[str], cancel_event=None,
+    ) -> List[Tuple[bool, str]]:
+        """Translate texts as batches, reporting (ok, result) per segment.
+
+        Segments the batch reply drops or garbles are already retried here as
+        single requests, so callers should not retry the failed slots again.
+        Once ``cancel_event`` is set no further requests are sent and the
+        remaining slots come back as ``(False, "cancelled")``.
+        """
         if not texts:
-            return True, []
+            return []
+        if cancel_event is not None and cancel_event.is_set():
+            return [(False, "cancelled")] * len(texts)
         if len(texts) == 1:
-            ok, result = self.translate_once(texts[0], tgt, src_lang)
-            return ok, [result]
+            return [self.translate_once(texts[0], tgt, src_lang)]
         if self._is_translation_dedicated():
-            results: List[str] = []
-            all_ok = True
-            for text in texts:
-                ok, result = self.translate_once(text, tgt, src_lang)
-                if not ok:
-                    all_ok = False
-                results.append(result)
-            return all_ok, results
+            return self._translate_each(texts, tgt, src_lang, cancel_event)
+
+        total_chars = sum(len(t) for t in texts)
+        if total_chars > self._target_batch_chars:
+            return self._translate_sub_batches(texts, tgt, src_lang, cancel_event)
 
         payload = self._build_batch_translate_payload(texts, tgt, src_lang)
         last = None
+        delay = 0.0
         for attempt in range(1, API_ATTEMPTS + 1):
             try:
                 ok, result = self._call_ollama(payload)
                 if ok:
                     results = self._parse_batch_response(result, len(texts))
                     if len(results) == len(texts):
-                        return True, results
+                        # A partial marker parse comes back padded to
+                        # len(texts): empty slots are segments the model
+                        # dropped, which is a sizing failure too.
+                        outcomes = [(True, r) for r in results]
+                        if self._fill_missing_segments(texts, outcomes, tgt, src_lang, cancel_event):
+                            self._shrink_batch_target(total_chars)
+                        else:
+                            self._grow_batch_target()
+                        return outcomes
                     logger.warning(
                         "Batch response parse mismatch: expected %s segments, got %s. Attempt %s/%s.",
                         len(texts),
@@ -750,18 +1247,102 @@ class OllamaClient:
                         attempt,
                         API_ATTEMPTS,
                     )
-                    last = f"Batch parse failed: expected {len(texts)} segments, got {len(results)}"
+                    if self._shrink_batch_target(total_chars):
+                        return self._translate_sub_batches(texts, tgt, src_lang, cancel_event)
+                    # Re-sending the same prompt tends to garble the same way:
+                    # translate the segments as independent concurrent requests.
+                    return self._translate_each(texts, tgt, src_lang, cancel_event)
                 else:
                     last = result
+                    if result.startswith(_CIRCUIT_OPEN):
+                        break
+                    if any(kw in result.lower() for kw in _CONTEXT_ERROR_KEYWORDS) and self._shrink_batch_target(total_chars):
+                        return self._translate_sub_batches(texts, tgt, src_lang, cancel_event)
             except requests.exceptions.RequestException as exc:
                 last = f"Request error: {exc}"
-            time.sleep(API_BACKOFF_BASE * attempt)
-        return False, [str(last)] * len(texts)
+            if attempt < API_ATTEMPTS:
+                delay = _next_backoff(delay)
+                time.sleep(delay)
+        return [(False, str(last))] * len(texts)
+
+    def _translate_one_unless_cancelled(
+        self, text: str, tgt: str, src_lang: Optional[str], cancel_event=None,
+    ) -> Tuple[bool, str]:
+        if cancel_event is not None and cancel_event.is_set():
+            return False, "cancelled"
+        return self.translate_once(text, tgt, src_lang)
+
+    def _translate_each(
+        self, texts: List[str], tgt: str, src_lang: Optional[str], cancel_event=None,
+    ) -> List[Tuple[bool, str]]:
+        """Translate texts as independent requests over the pooled session, preserving order."""
+        return _map_concurrent(
+            lambda text: self._translate_one_unless_cancelled(text, tgt, src_lang, cancel_event), texts,
+        )
+
+    def _fill_missing_segments(
+        self,
+        texts: List[str],
+        outcomes: List[Tuple[bool, str]],
+        tgt: str,
+        src_lang: Optional[str],
+        cancel_event=None,
+    ) -> int:
+        """Translate segments a batch reply left empty (partial <<<SEG_N>>> parse) in place.
+
+        A slot whose fallback request fails keeps that request's (False, error)
+        outcome. Returns the number of segments that needed a fallback request.
+        """
+        missing = [i for i, (_, r) in enumerate(outcomes) if not r and texts[i].strip()]
+        if not missing:
+            return 0
+        filled = _map_concurrent(
+            lambda i: self._translate_one_unless_cancelled(texts[i], tgt, src_lang, cancel_event), missing,
+        )
+        for i, outcome in zip(missing, filled):
+            outcomes[i] = outcome
+        logger.warning(
+            "[BATCH] reply dropped %d/%d segments; filled individually (%d failed)",
+            len(missing), len(texts), sum(1 for ok, _ in filled if not ok),
+        )
+        return len(missing)
+
+    def _shrink_batch_target(self, failed_chars: int) -> bool:
+        """Shrink the batch target below a failed batch; True if it can now be split.
+
+        Batches already at the size floor leave the target alone: their
+        failure is not a size problem.
+        """
+        with self._batch_target_lock:
+            target = max(float(_MIN_TARGET_BATCH_CHARS), min(self._target_batch_chars, failed_chars) * _BATCH_SHRINK)
+            if failed_chars <= target:
+                return False
+            self._target_batch_chars = target
+        logger.info("[BATCH] target batch size reduced to %d chars", target)
+        return True
+
+    def _grow_batch_target(self) -> None:
+        """Grow the batch target after a fully parsed batch, up to the configured maximum."""
+        with self._batch_target_lock:
+            self._target_batch_chars = min(float(DEFAULT_MAX_BATCH_CHARS), self._target_batch_chars * _BATCH_GROW)
+
+    def _translate_sub_batches(
+        self, texts: List[str], tgt: str, src_lang: Optional[str], cancel_event=None,
+    ) -> List[Tuple[bool, str]]:
+        """Translate texts as consecutive sub-batches within the current target, preserving order.
+
+        Each sub-batch reports its own per-segment outcomes, so one failed
+        sub-batch does not mark the segments of the others as failed.
+        """
+        outcomes: List[Tuple[bool, str]] = []
+        for group in _pack_chunks(texts, int(self._target_batch_chars)):
+            outcomes.extend(self.translate_batch_outcomes(group, tgt, src_lang, cancel_event))
+        return outcomes
 
     @staticmethod
     def _strip_seg_markers(text: str) -> str:
         """Strip <<<SEG_N>>> markers from translated text."""
-        return re.sub(r'<<<SEG_\d+>>>\s*', '', text).strip()
+        return _SEG_MARKER_RE.sub('', text).strip()
 
     @staticmethod
     def _sanitize_translation(text: str) -> str:
@@ -774,33 +1355,23 @@ class OllamaClient:
             return text
 
         # Strip markdown bold/italic wrappers (e.g. **version**)
-        cleaned = re.sub(r'\*{1,2}(.+?)\*{1,2}', r'\1', text)
+        cleaned = _MD_EMPHASIS_RE.sub(r'\1', text)
 
         # Strip <<<SEP>>>, <<</SEP>>, <<END>>, <<</END>> and similar artefacts
-        cleaned = re.sub(r'<<<?\/?(?:SEP|END|SEG_\d+)>>>?', '', cleaned)
+        cleaned = _ARTEFACT_RE.sub('', cleaned)
 
         # Strip hallucinated XML-like tags (UPPERCASE tag names like <SEC_GEN>, </REV_CONTENT>)
         # These are document-structure annotations the model invents, not real content.
-        cleaned = re.sub(r'</?[A-Z][A-Z0-9_]*(?:\s[^>]*)?>',  '', cleaned)
+        cleaned = _XML_TAG_RE.sub('', cleaned)
 
         # Remove lines that look like LLM commentary / reasoning
-        commentary_patterns = re.compile(
-            r'^(?:'
-            r'(?:Final decision|Note|Output|Translation|Explanation|Answer|Result|Remark|Comment)'
-            r'\s*[:：]'
-            r'|→\s'
-            r'|\(Note[:：]'
-            r'|\((?:người|Revision|Version|Name|Date|Release|New Issue)[^)]*\)\s*$'
-            r')',
-            re.IGNORECASE,
-        )
         lines = cleaned.split('\n')
         kept: list[str] = []
         for line in lines:
             stripped = line.strip()
             if not stripped:
                 continue
-            if commentary_patterns.match(stripped):
+            if _COMMENTARY_RE.match(stripped):
                 continue
             # Drop lines that are purely parenthetical notes
             if stripped.startswith('(') and stripped.endswith(')') and len(stripped) > 20:
@@ -827,20 +1398,15 @@ class OllamaClient:
         """
         # Strategy 1: Try numbered segment markers (most reliable)
         results = [""] * expected_count
-        pattern = r'<<<SEG_(\d+)>>>\s*(.*?)(?=<<<SEG_|\Z)'
-        matches = re.findall(pattern, response, re.DOTALL)
-
-        if matches:
-            parsed_count = 0
-            for idx_str, content in matches:
-                try:
-                    idx = int(idx_str)
-                    if 0 <= idx < expected_count:
-                        results[idx] = content.strip()
-                        parsed_count += 1
-                except ValueError:
-                    continue
-
+        has_markers = False
+        parsed_count = 0
+        for idx, segment in _split_segments(response):
+            has_markers = True
+            if 0 <= idx < expected_count:
+                results[idx] = segment
+                parsed_count += 1
+
+        if has_markers:
             # If we got all segments, return
             if parsed_count == expected_count and all(r for r in results):
                 return results
@@ -851,28 +1417,26 @@ class OllamaClient:
                 return results
 
         # Strategy 2: Try legacy separator
-        separator = BATCH_SEPARATOR.strip()
-        parts = response.split(separator)
-        parts = [p.strip() for p in parts if p.strip()]
+        parts = _split_nonempty(response, _PRIMARY_BATCH_SEPARATOR)
         if len(parts) == expected_count:
             return [self._strip_seg_markers(p) for p in parts]
 
-        # Strategy 3: Try alternative separators
-        alternative_separators = [
-            "---SEGMENT_SEPARATOR---",
-            "\n---\n",
-            "\n\n---\n\n",
-            "---",
-        ]
-        for alt_sep in alternative_separators:
-            if alt_sep in response:
-                parts = response.split(alt_sep)
-                parts = [p.strip() for p in parts if p.strip()]
+        # Strategy 3: Try alternative separators. Every alternative contains
+        # "---", and a split can only yield expected_count parts if the
+        # separator occurs at least expected_count - 1 times, so most misses
+        # are rejected by a count instead of a full split. "---" always goes
+        # last and is always split: its parts feed the final fallback below.
+        if "---" in response:
+            for alt_sep in _ALT_BATCH_SEPARATORS:
+                occurrences = response.count(alt_sep)
+                if occurrences == 0 or (alt_sep != "---" and occurrences < expected_count - 1):
+                    continue
+                parts = _split_nonempty(response, alt_sep)
                 if len(parts) == expected_count:
                     return [self._strip_seg_markers(p) for p in parts]
 
         # Strategy 4: If numbered markers got partial results, use them
-        if matches and any(r for r in results):
+        if has_markers and any(r for r in results):
             logger.debug(f"Using partial numbered marker results: {sum(1 for r in results if r)}/{expected_count}")
             return results
 
@@ -881,25 +1445,30 @@ class OllamaClient:
         return cleaned
 
     def unload_model(self) -> Tuple[bool, str]:
-        try:
-            session = self._get_session()
-            num_gpu = self._build_options().get("num_gpu")
-            payload = {"model": self.model, "prompt": "", "keep_alive": 0, "options": {"num_gpu": num_gpu}}
-            resp = session.post(
-                self._gen_url("/api/generate"),
-                json=payload,
-                timeout=(self.timeout.connect_timeout, 30),
-            )
-            if resp.status_code == 200:
-                logger.info("Model %s unloaded successfully", self.model)
-                return True, f"Model {self.model} unloaded successfully"
-            msg = f"HTTP {resp.status_code}: {resp.text[:180]}"
-            logger.warning("Failed to unload model: %s", msg)
-            return False, msg
-        except requests.exceptions.RequestException as exc:
-            msg = f"Request error while unloading model: {exc}"
-            logger.warning(msg)
-            return False, msg
+        """Evict the model on every endpoint; generate calls may have loaded it on any of them."""
+        num_gpu = self._build_options().get("num_gpu")
+        body = _json_dumps({"model": self.model, "prompt": "", "keep_alive": 0, "options": {"num_gpu": num_gpu}})
+        errors: List[str] = []
+        for endpoint in self._endpoints:
+            try:
+                resp = self.session.post(
+                    self._generate_urls[endpoint],
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=(self.timeout.connect_timeout, 30),
+                )
+                if resp.status_code == 200:
+                    continue
+                msg = f"HTTP {resp.status_code}: {resp.text[:180]}"
+                logger.warning("Failed to unload model on %s: %s", endpoint, msg)
+            except requests.exceptions.RequestException as exc:
+                msg = f"Request error while unloading model: {exc}"
+                logger.warning("%s (%s)", msg, endpoint)
+            errors.append(msg if len(self._endpoints) == 1 else f"{endpoint}: {msg}")
+        if errors:
+            return False, "; ".join(errors)
+        logger.info("Model %s unloaded successfully", self.model)
+        return True, f"Model {self.model} unloaded successfully"
 
     # ------------------------------------------------------------------
     # LLMClient Protocol aliases (IP-2)
@@ -912,8 +1481,13 @@ class OllamaClient:
         return self.health_check()
 
     def list_models(self) -> List[str]:
-        """LLMClient Protocol alias: delegates to module-level list_ollama_models()."""
-        return list_ollama_models(self.base_url)
+        """LLMClient Protocol alias: delegates to module-level list_ollama_models().
+
+        Asks base_url unless its circuit is open, then the best-ranked live node.
+        """
+        live = self._live_endpoints()
+        endpoint = self.base_url if self.base_url in live or not live else live[0]
+        return list_ollama_models(endpoint)
 
     def unload(self) -> Tuple[bool, str]:
         """LLMClient Protocol alias: delegates to unload_model()."""
@@ -937,13 +1511,28 @@ class OllamaClient:
         return self._call_ollama(self._build_no_system_payload(prompt))
 
 
+# /api/tags is polled by UI renders and by LLMClient.list_models(); keep each
+# node's successful answer briefly. Failures are not cached.
+_MODELS_TTL_S = 30.0
+_models_cache: Dict[str, Tuple[float, List[str]]] = {}
+_models_lock = threading.Lock()
+
+
 def list_ollama_models(base_url: str = OLLAMA_BASE_URL, timeout: Optional[TimeoutConfig] = None) -> List[str]:
+    base_url = base_url.rstrip("/")
+    with _models_lock:
+        cached = _models_cache.get(base_url)
+    if cached is not None and time.monotonic() - cached[0] < _MODELS_TTL_S:
+        return list(cached[1])
     timeout = timeout or TimeoutConfig()
     try:
         session = OllamaClient._get_session()
-        resp = session.get(base_url.rstrip("/") + "/api/tags", timeout=timeout.get_timeout_tuple())
+        resp = session.get(base_url + "/api/tags", timeout=timeout.get_timeout_tuple())
         if resp.status_code == 200:
-            return [m.get("name", "") for m in (resp.json().get("models") or []) if isinstance(m, dict)]
+            names = [m.get("name", "") for m in (_json_loads(resp.content).get("models") or []) if isinstance(m, dict)]
+            with _models_lock:
+                _models_cache[base_url] = (time.monotonic(), names)
+            return list(names)
     except requests.exceptions.RequestException as exc:
         logger.debug("Failed to list Ollama models from %s: %s", base_url, exc)
     return [DEFAULT_MODEL]
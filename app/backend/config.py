@@ -113,6 +113,7 @@ OPENAI_TRANSLATION_REASONING: str = "low"
 
 API_ATTEMPTS = 3
 API_BACKOFF_BASE = 1.6
+API_BACKOFF_CAP = 15.0  # upper bound (seconds) on a single jittered retry wait
 SENTENCE_MODE = True
 INSERT_FONT_SIZE_PT = 10
 
@@ -326,10 +327,24 @@ MAX_JOBS_IN_MEMORY = int(os.environ.get("MAX_JOBS_IN_MEMORY", "100"))
 JOB_TTL_HOURS = int(os.environ.get("JOB_TTL_HOURS", "24"))
 CLEANUP_INTERVAL_MINUTES = int(os.environ.get("CLEANUP_INTERVAL_MINUTES", "30"))
 
-# Performance: HTTP connection pool
+# Performance: HTTP connection pool. HTTP_POOL_MAXSIZE is also the ceiling of
+# the adaptive per-endpoint concurrency limit for Ollama generate requests.
 HTTP_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", "2"))
 HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "5"))
 
+# Performance: Ollama circuit breaker. After this many consecutive failed
+# requests (connection error / HTTP 5xx) calls to that endpoint fail fast for
+# the recovery window, then a single trial request decides whether to close.
+OLLAMA_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("OLLAMA_CIRCUIT_FAILURE_THRESHOLD", "5"))
+OLLAMA_CIRCUIT_RECOVERY_S = float(os.environ.get("OLLAMA_CIRCUIT_RECOVERY_S", "30"))
+
+# Additional Ollama nodes (comma-separated URLs) serving the same models.
+# Generate requests go to the endpoint with the lowest recent latency and fail
+# over to the others when one is unreachable or its circuit is open.
+OLLAMA_FALLBACK_URLS = [
+    u.strip().rstrip("/") for u in os.environ.get("OLLAMA_FALLBACK_URLS", "").split(",") if u.strip()
+]
+
 ENV_CONNECT_TIMEOUT = "TRANSLATE_CONNECT_TIMEOUT"
 ENV_READ_TIMEOUT = "TRANSLATE_READ_TIMEOUT"
 
@@ -479,6 +494,8 @@ JOBS_DIR = DATA_DIR / "jobs"
 LOG_DIR = DATA_DIR / "logs"
 TRANSLATION_CACHE_ENABLED = os.environ.get("TRANSLATION_CACHE_ENABLED", "1").lower() in ("1", "true", "yes")
 CACHE_DIR = DATA_DIR / "cache"
+# Entries held in the in-process LRU in front of the SQLite cache (0 disables).
+TRANSLATION_CACHE_MEMORY_ENTRIES = int(os.environ.get("TRANSLATION_CACHE_MEMORY_ENTRIES", "10000"))
 
 DEFAULT_HOST = os.environ.get("TRANSLATE_TOOL_HOST", "127.0.0.1")
 DEFAULT_PORT = int(os.environ.get("TRANSLATE_TOOL_PORT", "8765"))
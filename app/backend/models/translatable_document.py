@@ -6,9 +6,10 @@ supporting coordinate-based layout preservation.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
 
 
 class ElementType(Enum):
@@ -35,7 +36,7 @@ class ElementType(Enum):
 # Table/Cell IR (p3-table-structure)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """In-memory representation of a single recognized table cell.
 
@@ -83,7 +84,7 @@ class TableCell:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TableStructure:
     """In-memory representation of a recognized table structure.
 
@@ -127,7 +128,7 @@ class TableStructure:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Bounding box coordinates.
 
@@ -185,7 +186,7 @@ class BoundingBox:
         return cls(x0=coords[0], y0=coords[1], x1=coords[2], y1=coords[3])
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleInfo:
     """Text style information."""
 
@@ -223,9 +224,15 @@ class StyleInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslatableElement:
-    """A translatable element in the document."""
+    """A translatable element in the document.
+
+    ``metadata`` holds plain values only. Parsers point back at their source
+    nodes with locators (e.g. DOCX ``paragraph_idx``, PPTX ``shape_path``)
+    rather than live python-docx/python-pptx objects, so a document does not
+    keep the parsed file's object tree alive.
+    """
 
     element_id: str
     content: str
@@ -238,6 +245,17 @@ class TranslatableElement:
     metadata: Dict[str, Any] = field(default_factory=dict)
     reading_order: Optional[int] = None
     render_truncated: bool = False  # Added p2-text-expansion (BR-38, ADR-0004)
+    # (content, content.strip()) memo for stripped_content; not serialized.
+    _stripped: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def stripped_content(self) -> str:
+        """``content.strip()``, computed once until ``content`` is reassigned."""
+        cached = self._stripped
+        if cached is None or cached[0] is not self.content:
+            cached = (self.content, self.content.strip())
+            self._stripped = cached
+        return cached[1]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -273,7 +291,7 @@ class TranslatableElement:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PageInfo:
     """Information about a document page."""
 
@@ -302,7 +320,7 @@ class PageInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """Document-level metadata."""
 
@@ -346,7 +364,18 @@ class DocumentMetadata:
         )
 
 
-@dataclass
+def _reading_order_key(e: TranslatableElement) -> int:
+    return e.reading_order
+
+
+def _positional_key(e: TranslatableElement) -> tuple:
+    bbox = e.bbox
+    if bbox is None:
+        return (e.page_num, 0, 0)
+    return (e.page_num, bbox.y0, bbox.x0)
+
+
+@dataclass(slots=True)
 class TranslatableDocument:
     """A document ready for translation."""
 
@@ -371,12 +400,10 @@ class TranslatableDocument:
         Returns:
             Dict mapping page numbers to lists of elements on that page.
         """
-        result: Dict[int, List[TranslatableElement]] = {}
+        result: DefaultDict[int, List[TranslatableElement]] = defaultdict(list)
         for e in self.elements:
-            if e.page_num not in result:
-                result[e.page_num] = []
             result[e.page_num].append(e)
-        return result
+        return dict(result)
 
     def get_elements_in_reading_order(self) -> List[TranslatableElement]:
         """Get elements sorted by reading order.
@@ -388,27 +415,26 @@ class TranslatableDocument:
         those without within the same page, as the explicit index is authoritative.
         """
 
-        def sort_key(e: TranslatableElement) -> tuple:
-            if e.reading_order is not None:
-                # Authoritative: (0, reading_order) sorts before positional fallback
-                return (0, e.reading_order, 0, 0)
-            # Positional fallback
-            y0 = e.bbox.y0 if e.bbox else 0
-            x0 = e.bbox.x0 if e.bbox else 0
-            return (1, e.page_num, y0, x0)
+        # Partition once instead of building a 4-tuple key per element: the
+        # explicit group always sorts first, so each side only needs its own
+        # (cheaper) key and the two stable sorts concatenate to the same order.
+        explicit: List[TranslatableElement] = []
+        positional: List[TranslatableElement] = []
+        for e in self.elements:
+            (positional if e.reading_order is None else explicit).append(e)
 
-        return sorted(self.elements, key=sort_key)
+        explicit.sort(key=_reading_order_key)
+        positional.sort(key=_positional_key)
+        return explicit + positional
 
     def get_unique_texts(self) -> List[str]:
         """Get unique translatable texts for deduplication."""
-        seen = set()
-        unique = []
-        for e in self.get_translatable_elements():
-            text = e.content.strip()
-            if text and text not in seen:
-                seen.add(text)
-                unique.append(text)
-        return unique
+        # dict preserves insertion order, so fromkeys dedups in first-seen order.
+        return list(dict.fromkeys(
+            text
+            for e in self.elements
+            if e.should_translate and (text := e.stripped_content)
+        ))
 
     def apply_translations(self, translations: Dict[str, str]) -> None:
         """Apply translated content to elements.
@@ -416,11 +442,13 @@ class TranslatableDocument:
         Args:
             translations: Mapping from original text to translated text.
         """
+        if not translations:
+            return
         for element in self.elements:
             if element.should_translate:
-                original = element.content.strip()
-                if original in translations:
-                    element.translated_content = translations[original]
+                translated = translations.get(element.stripped_content)
+                if translated is not None:
+                    element.translated_content = translated
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
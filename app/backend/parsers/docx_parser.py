@@ -6,13 +6,16 @@ information into a TranslatableDocument format.
 
 from __future__ import annotations
 
+import itertools
 import logging
+import sys
 import uuid
 from pathlib import Path
-from typing import Any, Iterator, List, Optional, Set, Tuple
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
 
 import docx
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 
@@ -33,6 +36,50 @@ logger = logging.getLogger(__name__)
 # Marker used to identify previously inserted translations
 INSERT_MARKER = "\u200b"
 
+# Text-bearing run children, compiled once. Prefixed names are matched by the
+# XPath engine directly instead of evaluating local-name() on every node.
+_TEXT_NODES = etree.XPath(".//w:t|.//w:br|.//w:tab", namespaces={"w": nsmap["w"]})
+_T_TAG = qn("w:t")
+_BR_TAG = qn("w:br")
+
+# Block-level container children, compared by equality against Clark names.
+_P_TAG = qn("w:p")
+_TBL_TAG = qn("w:tbl")
+_SDT_TAG = qn("w:sdt")
+_TXBX_CONTENT_TAG = qn("w:txbxContent")
+
+
+def _run_text(p_element: Any) -> str:
+    """Concatenate w:t text under a paragraph element; w:br -> newline, w:tab -> space."""
+    parts = []
+    for node in _TEXT_NODES(p_element):
+        tag = node.tag
+        if tag == _T_TAG:
+            parts.append(node.text or "")
+        elif tag == _BR_TAG:
+            parts.append("\n")
+        else:  # tab
+            parts.append(" ")
+    return "".join(parts)
+
+
+def _classify_style_name(style_name: Optional[str]) -> ElementType:
+    """Map a paragraph style name to an ElementType."""
+    style_name = style_name.lower() if style_name else ""
+
+    if "heading" in style_name or "title" in style_name:
+        return ElementType.TITLE
+    if "header" in style_name:
+        return ElementType.HEADER
+    if "footer" in style_name:
+        return ElementType.FOOTER
+    if "caption" in style_name:
+        return ElementType.CAPTION
+    if "list" in style_name:
+        return ElementType.LIST_ITEM
+
+    return ElementType.TEXT
+
 
 class DocxParser(BaseParser):
     """Parser for DOCX documents.
@@ -58,6 +105,17 @@ class DocxParser(BaseParser):
         self.max_segments = max_segments
         self.max_text_length = max_text_length
         self.skip_inserted_translations = skip_inserted_translations
+        self._style_cache: Dict[Optional[str], Tuple[Optional[str], ElementType]] = {}
+        # Side tables for the XML nodes behind the last parse's elements, addressed
+        # by metadata["paragraph_idx"] / metadata["textbox_idx"].
+        self.paragraph_refs: List[Any] = []
+        self.textbox_refs: List[Any] = []
+        # Running totals for the size limits, checked as each element is admitted.
+        self._segment_count = 0
+        self._text_length = 0
+        # Element ids: one random run prefix per parse plus a counter
+        self._id_run = ""
+        self._id_seq: Iterator[int] = itertools.count()
 
     @property
     def supported_extensions(self) -> list[str]:
@@ -76,6 +134,8 @@ class DocxParser(BaseParser):
         Raises:
             FileNotFoundError: If file does not exist.
             ValueError: If file is not a DOCX.
+            DocumentSizeLimitExceeded: As soon as the extracted segments or
+                text exceed the configured limits.
         """
         path = Path(file_path)
         if not path.exists():
@@ -84,36 +144,30 @@ class DocxParser(BaseParser):
             raise ValueError(f"Not a DOCX file: {file_path}")
 
         doc = docx.Document(file_path)
+        self._style_cache = {}
+        self.paragraph_refs = []
+        self.textbox_refs = []
+        self._segment_count = 0
+        self._text_length = 0
+        self._id_run = uuid.uuid4().hex[:8]
+        self._id_seq = itertools.count()
 
         elements: List[TranslatableElement] = []
-        seen_keys: Set[str] = set()
-        total_text_length = 0
+        seen_keys: Set[Hashable] = set()
 
-        # Extract from body (paragraphs, tables, SDT)
-        body_elements = self._extract_from_container(
-            doc._body, "Body", seen_keys, total_text_length
+        # Extract from body (paragraphs, tables, SDT). Size limits are enforced
+        # per element (see _admit), so oversized documents stop extracting early.
+        elements.extend(
+            self._extract_from_container(doc._body._element, doc._body, "Body", seen_keys)
         )
-        elements.extend(body_elements)
-        total_text_length += sum(len(e.content) for e in body_elements)
 
         # Extract from text boxes
-        textbox_elements = self._extract_from_textboxes(doc, seen_keys)
-        elements.extend(textbox_elements)
-        total_text_length += sum(len(e.content) for e in textbox_elements)
+        elements.extend(self._extract_from_textboxes(doc, seen_keys))
 
         # Assign reading_order from extraction sequence
         for idx, elem in enumerate(elements):
             elem.reading_order = idx
 
-        # Validate document size
-        check_document_size_limits(
-            segment_count=len(elements),
-            total_text_length=total_text_length,
-            max_segments=self.max_segments,
-            max_text_length=self.max_text_length,
-            document_type="Word document",
-        )
-
         # Build metadata
         core_props = doc.core_properties
         metadata = DocumentMetadata(
@@ -137,45 +191,49 @@ class DocxParser(BaseParser):
 
     def _extract_from_container(
         self,
-        container: Any,
+        element: Any,
+        parent: Any,
         context: str,
-        seen_keys: Set[str],
-        current_length: int,
+        seen_keys: Set[Hashable],
     ) -> List[TranslatableElement]:
-        """Extract elements from a container (body, cell, etc.).
+        """Extract elements from a container element (body, cell, SDT content).
 
         Args:
-            container: Container object with _element attribute.
+            element: Container XML element whose children are walked.
+            parent: python-docx object owning ``element`` (body, cell, ...);
+                used as the parent of the Paragraph/Table proxies so style
+                lookups can reach the document part.
             context: Context string for logging.
             seen_keys: Set of already-seen paragraph keys.
-            current_length: Current total text length.
 
         Returns:
             List of extracted elements.
         """
         elements: List[TranslatableElement] = []
 
-        if container._element is None:
+        if element is None:
             return elements
 
-        for child_element in container._element:
-            qname = child_element.tag
+        for child_element in element:
+            tag = child_element.tag
 
-            if qname.endswith("}p"):
+            if tag == _P_TAG:
                 # Paragraph
-                p = Paragraph(child_element, container)
+                p = Paragraph(child_element, parent)
                 elem = self._extract_paragraph(p, context, seen_keys)
                 if elem:
                     elements.append(elem)
 
-            elif qname.endswith("}tbl"):
+            elif tag == _TBL_TAG:
                 # Table
-                table = Table(child_element, container)
+                table = Table(child_element, parent)
                 for r_idx, row in enumerate(table.rows, 1):
                     for c_idx, cell in enumerate(row.cells, 1):
-                        cell_ctx = f"{context} > Tbl(r{r_idx},c{c_idx})"
+                        # Interned: the same labels recur across tables and
+                        # every element in the cell carries one in metadata.
+                        cell_ctx = sys.intern(f"{context} > Tbl(r{r_idx},c{c_idx})")
                         cell_elements = self._extract_from_container(
-                            cell, cell_ctx, seen_keys, current_length
+                            cell._element, cell, cell_ctx, seen_keys
                         )
                         # Mark as table cells
                         for elem in cell_elements:
@@ -185,10 +243,10 @@ class DocxParser(BaseParser):
                             elem.metadata["col"] = c_idx
                         elements.extend(cell_elements)
 
-            elif qname.endswith("}sdt"):
+            elif tag == _SDT_TAG:
                 # Structured Document Tag (content controls)
                 sdt_elements = self._extract_from_sdt(
-                    child_element, f"{context} > SDT", seen_keys
+                    child_element, parent, sys.intern(f"{context} > SDT"), seen_keys
                 )
                 elements.extend(sdt_elements)
 
@@ -198,7 +256,7 @@ class DocxParser(BaseParser):
         self,
         p: Paragraph,
         context: str,
-        seen_keys: Set[str],
+        seen_keys: Set[Hashable],
     ) -> Optional[TranslatableElement]:
         """Extract a single paragraph.
 
@@ -225,31 +283,34 @@ class DocxParser(BaseParser):
         seen_keys.add(key)
 
         # Determine element type based on style
-        element_type = self._classify_paragraph_type(p)
+        style_name, element_type = self._classify_paragraph_type(p)
 
-        return TranslatableElement(
-            element_id=f"docx_{uuid.uuid4().hex[:8]}",
+        return self._admit(TranslatableElement(
+            element_id=self._next_id("docx"),
             content=text,
             element_type=element_type,
             page_num=1,  # DOCX doesn't have clear page numbers
             should_translate=True,
             metadata={
                 "context": context,
-                "style": p.style.name if p.style else None,
-                "paragraph_ref": p,  # Keep reference for rendering
+                "style": style_name,
+                # Index into self.paragraph_refs; keeps metadata JSON-safe
+                "paragraph_idx": self._add_ref(self.paragraph_refs, p._p),
             },
-        )
+        ))
 
     def _extract_from_sdt(
         self,
         sdt_element: Any,
+        parent: Any,
         context: str,
-        seen_keys: Set[str],
+        seen_keys: Set[Hashable],
     ) -> List[TranslatableElement]:
         """Extract from Structured Document Tag.
 
         Args:
             sdt_element: SDT XML element.
+            parent: python-docx object of the container holding the SDT.
             context: Context string.
             seen_keys: Set of already-seen keys.
 
@@ -269,14 +330,14 @@ class DocxParser(BaseParser):
             full_placeholder = "".join(placeholder_texts).strip()
             if full_placeholder:
                 elements.append(
-                    TranslatableElement(
-                        element_id=f"sdt_ph_{uuid.uuid4().hex[:8]}",
+                    self._admit(TranslatableElement(
+                        element_id=self._next_id("sdt_ph"),
                         content=full_placeholder,
                         element_type=ElementType.TEXT,
                         page_num=1,
                         should_translate=True,
                         metadata={"context": f"{context}-Placeholder", "sdt_type": "placeholder"},
-                    )
+                    ))
                 )
 
         # Extract dropdown items
@@ -288,28 +349,22 @@ class DocxParser(BaseParser):
 
         if list_items:
             elements.append(
-                TranslatableElement(
-                    element_id=f"sdt_dd_{uuid.uuid4().hex[:8]}",
+                self._admit(TranslatableElement(
+                    element_id=self._next_id("sdt_dd"),
                     content="\n".join(list_items),
                     element_type=ElementType.LIST_ITEM,
                     page_num=1,
                     should_translate=True,
                     metadata={"context": f"{context}-Dropdown", "sdt_type": "dropdown"},
-                )
+                ))
             )
 
         # Extract content from sdtContent
         sdt_content = sdt_element.find(qn("w:sdtContent"))
         if sdt_content is not None:
-            # Create wrapper for recursive processing
-            class SdtContentWrapper:
-                def __init__(self, element, parent):
-                    self._element = element
-                    self._parent = parent
-
-            wrapper = SdtContentWrapper(sdt_content, None)
+            # Block content of the control belongs to the enclosing container
             content_elements = self._extract_from_container(
-                wrapper, context, seen_keys, 0
+                sdt_content, parent, context, seen_keys
             )
             elements.extend(content_elements)
 
@@ -318,7 +373,7 @@ class DocxParser(BaseParser):
     def _extract_from_textboxes(
         self,
         doc: Any,
-        seen_keys: Set[str],
+        seen_keys: Set[Hashable],
     ) -> List[TranslatableElement]:
         """Extract text from text boxes.
 
@@ -339,23 +394,23 @@ class DocxParser(BaseParser):
             if not (has_cjk(text) or should_translate(text, "auto")):
                 continue
 
-            key = f"txbx_{hash(text)}_{len(text)}"
+            key = ("txbx", text)
             if key in seen_keys:
                 continue
             seen_keys.add(key)
 
             elements.append(
-                TranslatableElement(
-                    element_id=f"txbx_{uuid.uuid4().hex[:8]}",
+                self._admit(TranslatableElement(
+                    element_id=self._next_id("txbx"),
                     content=text,
                     element_type=ElementType.TEXT,
                     page_num=1,
                     should_translate=True,
                     metadata={
                         "context": "TextBox",
-                        "textbox_ref": txbx,  # Keep reference for rendering
+                        "textbox_idx": self._add_ref(self.textbox_refs, txbx),
                     },
-                )
+                ))
             )
 
         return elements
@@ -369,18 +424,16 @@ class DocxParser(BaseParser):
         Yields:
             Tuples of (textbox_element, text_content).
         """
-        for tx in doc._element.xpath(".//*[local-name()='txbxContent']"):
+        # Element.iter() walks the tree once in C; no XPath evaluation per level.
+        for tx in doc._element.iter(_TXBX_CONTENT_TAG):
             kept = []
-            for p in tx.xpath(".//*[local-name()='p']"):
+            for p in tx.iter(_P_TAG):
                 text = self._get_textbox_paragraph_text(p)
-                if not text.strip():
-                    continue
                 # Skip our inserted translations
                 if INSERT_MARKER in text:
                     continue
-                for line in text.split("\n"):
-                    if line.strip():
-                        kept.append(line.strip())
+                # One strip per line; blank lines (and blank paragraphs) drop out
+                kept.extend(line for line in map(str.strip, text.split("\n")) if line)
 
             if kept:
                 yield tx, "\n".join(kept)
@@ -394,16 +447,7 @@ class DocxParser(BaseParser):
         Returns:
             Text content with line breaks.
         """
-        parts = []
-        for node in p._p.xpath(".//*[local-name()='t' or local-name()='br' or local-name()='tab']"):
-            tag = node.tag.split("}", 1)[-1]
-            if tag == "t":
-                parts.append(node.text or "")
-            elif tag == "br":
-                parts.append("\n")
-            else:  # tab
-                parts.append(" ")
-        return "".join(parts).strip()
+        return _run_text(p._p).strip()
 
     def _get_textbox_paragraph_text(self, p_element: Any) -> str:
         """Get text from a textbox paragraph element.
@@ -414,16 +458,35 @@ class DocxParser(BaseParser):
         Returns:
             Text content.
         """
-        parts = []
-        for node in p_element.xpath(".//*[local-name()='t' or local-name()='br' or local-name()='tab']"):
-            tag = node.tag.split("}", 1)[-1]
-            if tag == "t":
-                parts.append(node.text or "")
-            elif tag == "br":
-                parts.append("\n")
-            else:
-                parts.append(" ")
-        return "".join(parts)
+        return _run_text(p_element)
+
+    def _admit(self, elem: TranslatableElement) -> TranslatableElement:
+        """Count an extracted element against the size limits.
+
+        Raises:
+            DocumentSizeLimitExceeded: If this element pushes the document over
+                max_segments or max_text_length.
+        """
+        self._segment_count += 1
+        self._text_length += len(elem.content)
+        check_document_size_limits(
+            segment_count=self._segment_count,
+            total_text_length=self._text_length,
+            max_segments=self.max_segments,
+            max_text_length=self.max_text_length,
+            document_type="Word document",
+        )
+        return elem
+
+    def _next_id(self, prefix: str) -> str:
+        """Return an element id unique within this parse (and across parses)."""
+        return f"{prefix}_{self._id_run}_{next(self._id_seq):x}"
+
+    @staticmethod
+    def _add_ref(refs: List[Any], node: Any) -> int:
+        """Append an XML node to a side table and return its index."""
+        refs.append(node)
+        return len(refs) - 1
 
     def _is_inserted_translation(self, p: Paragraph) -> bool:
         """Check if paragraph is an inserted translation.
@@ -436,42 +499,39 @@ class DocxParser(BaseParser):
         """
         return any(INSERT_MARKER in (r.text or "") for r in p.runs)
 
-    def _get_paragraph_key(self, p: Paragraph, text: str) -> str:
-        """Generate a unique key for a paragraph.
+    def _get_paragraph_key(self, p: Paragraph, text: str) -> Tuple[str, str]:
+        """Generate a deduplication key for a paragraph.
+
+        Paragraphs are deduplicated by their extracted text. The key is tagged
+        so it can never collide with a textbox key in the shared seen set.
 
         Args:
             p: Paragraph object.
             text: Paragraph text.
 
         Returns:
-            Unique key string.
+            Hashable key tuple.
         """
-        try:
-            xml_content = p._p.xml if hasattr(p._p, "xml") else str(p._p)
-            return f"{hash(xml_content)}_{len(text)}_{text[:50]}"
-        except (AttributeError, TypeError):
-            return f"fallback_{hash(text)}_{len(text)}"
+        return ("p", text)
 
-    def _classify_paragraph_type(self, p: Paragraph) -> ElementType:
+    def _classify_paragraph_type(self, p: Paragraph) -> Tuple[Optional[str], ElementType]:
         """Classify paragraph type based on style.
 
+        Resolving ``p.style`` walks the styles part, so the result is cached
+        per parse on the paragraph's raw ``w:pStyle`` id (None = default style).
+
         Args:
             p: Paragraph to classify.
 
         Returns:
-            ElementType for the paragraph.
+            Tuple of (style name, ElementType) for the paragraph.
         """
-        style_name = p.style.name.lower() if p.style else ""
-
-        if "heading" in style_name or "title" in style_name:
-            return ElementType.TITLE
-        if "header" in style_name:
-            return ElementType.HEADER
-        if "footer" in style_name:
-            return ElementType.FOOTER
-        if "caption" in style_name:
-            return ElementType.CAPTION
-        if "list" in style_name:
-            return ElementType.LIST_ITEM
-
-        return ElementType.TEXT
+        style_id = p._p.style
+        cached = self._style_cache.get(style_id)
+        if cached is None:
+            style = p.style
+            style_name = style.name if style else None
+            cached = (style_name, _classify_style_name(style_name))
+            self._style_cache[style_id] = cached
+        return cached
+
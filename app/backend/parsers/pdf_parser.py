@@ -6,8 +6,12 @@ reading order sorting, and header/footer detection.
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import logging
+import sys
 import uuid
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -33,6 +37,51 @@ from app.backend.utils.bbox_utils import is_header_footer_region, normalize_bbox
 
 logger = logging.getLogger(__name__)
 
+# Element id suffixes: one random prefix per process plus a shared counter.
+# next() on itertools.count is atomic under the GIL, so a parser instance
+# shared across jobs still hands out unique ids without a urandom call each.
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_ID_COUNTER = itertools.count()
+
+
+def _new_id_suffix() -> str:
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):08x}"
+
+# get_text("dict") flags: the defaults minus TEXT_PRESERVE_IMAGES. Image blocks
+# are skipped by every caller, so MuPDF need not copy their pixel data into the
+# dict. Ligature/whitespace handling is unchanged.
+_TEXT_DICT_FLAGS = (
+    fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES if fitz is not None else 0
+)
+
+# Slack (points) allowed when testing whether an element lies inside a table.
+_INSIDE_TOLERANCE_PT = 5.0
+
+
+class _TopEdgeIndex:
+    """Elements with a bbox, indexed by top edge for vertical range queries.
+
+    A table can only contain elements whose y0 lies within its (padded)
+    vertical span, so bisecting on y0 replaces a scan of every page element
+    per table.
+    """
+
+    __slots__ = ("_keys", "_items")
+
+    def __init__(self, elements: List[TranslatableElement]):
+        entries = sorted(
+            ((e.bbox.y0, i, e) for i, e in enumerate(elements) if e.bbox),
+            key=lambda t: (t[0], t[1]),
+        )
+        self._keys = [t[0] for t in entries]
+        self._items = [(t[1], t[2]) for t in entries]
+
+    def candidates(self, y_min: float, y_max: float) -> List[TranslatableElement]:
+        """Elements with y_min <= bbox.y0 <= y_max, in original list order."""
+        lo = bisect.bisect_left(self._keys, y_min)
+        hi = bisect.bisect_right(self._keys, y_max)
+        return [e for _, e in sorted(self._items[lo:hi], key=lambda t: t[0])]
+
 
 class PyMuPDFParser(BaseParser):
     """PDF parser using PyMuPDF library.
@@ -86,16 +135,21 @@ class PyMuPDFParser(BaseParser):
             ValueError: If file is not a PDF.
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
         if path.suffix.lower() != ".pdf":
             raise ValueError(f"Not a PDF file: {file_path}")
+        # Single open: read the bytes once and let MuPDF parse from memory
+        # rather than stat-ing the path and having fitz re-open it.
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
-        doc = fitz.open(file_path)
+        doc = fitz.open(stream=data, filetype="pdf")
         try:
             elements: List[TranslatableElement] = []
             pages: List[PageInfo] = []
             total_chars = 0
+            table_counter = 0
 
             from app.backend.config import OCR_ENABLED as _OCR_ENABLED
             _NEAR_EMPTY_CHAR_THRESHOLD = 10  # chars per page below which OCR is attempted
@@ -110,9 +164,13 @@ class PyMuPDFParser(BaseParser):
                 )
                 pages.append(page_info)
 
+                # One MuPDF TextPage per page, shared by block extraction and
+                # any per-cell table split below instead of re-parsing the page.
+                textpage = page.get_textpage(flags=_TEXT_DICT_FLAGS)
+
                 # Extract text blocks with bbox (paragraph-aggregated, AC-2)
                 page_elements = self._extract_page_elements(
-                    page, page_num + 1, page_info.height
+                    page, page_num + 1, page_info.height, textpage=textpage
                 )
 
                 # OCR routing for near-empty pages (AC-7, D-7)
@@ -133,13 +191,19 @@ class PyMuPDFParser(BaseParser):
                             len(page_text),
                         )
 
-                elements.extend(page_elements)
-
                 # Count chars for text layer detection
                 total_chars += sum(len(e.content) for e in page_elements)
 
-            # Detect tables and update element types
-            self._detect_and_mark_tables(doc, elements)
+                # Detect tables and update element types while the page is loaded
+                # (one pass over the document instead of a second page loop).
+                rebuilt, table_counter = self._mark_page_tables(
+                    page, page_num + 1, page_elements, table_counter, textpage=textpage
+                )
+                if rebuilt is not None:
+                    page_elements = rebuilt
+                del textpage
+
+                elements.extend(page_elements)
 
             # Layout-detector path (native-PDF text-layer only):
             # Rasterise each page, run detector, write element_type + reading_order.
@@ -185,6 +249,7 @@ class PyMuPDFParser(BaseParser):
         page: Any,  # fitz.Page
         page_num: int,
         page_height: float,
+        textpage: Any = None,  # fitz.TextPage
     ) -> List[TranslatableElement]:
         """Extract text elements from a page with paragraph aggregation (D-2, AC-2).
 
@@ -201,14 +266,17 @@ class PyMuPDFParser(BaseParser):
             page: PyMuPDF page object.
             page_num: 1-based page number.
             page_height: Page height in points.
+            textpage: Pre-built TextPage for this page, if the caller has one.
 
         Returns:
             List of TranslatableElement objects (one per block, not per line).
         """
         elements: List[TranslatableElement] = []
+        # A page uses a handful of colours: format each hex string once.
+        color_hex: Dict[int, str] = {}
 
         # Use dict mode for block→line→span granularity
-        text_dict = page.get_text("dict", sort=True)
+        text_dict = page.get_text("dict", sort=True, flags=_TEXT_DICT_FLAGS, textpage=textpage)
 
         for block_no, block in enumerate(text_dict.get("blocks", [])):
             # Skip image blocks (type=1)
@@ -222,30 +290,20 @@ class PyMuPDFParser(BaseParser):
             # --- Paragraph aggregation: collect all lines in this block ---
             block_text_parts: List[str] = []
             block_line_bboxes: List[tuple] = []
-            block_style: Optional[StyleInfo] = None
+            style_span: Optional[dict] = None
 
             for line in block_lines:
                 line_bbox = line.get("bbox", (0, 0, 0, 0))
 
-                # Collect text and style from all spans in this line
+                # Collect text from all spans in this line
                 line_text_parts: List[str] = []
                 for span in line.get("spans", []):
                     span_text = span.get("text", "")
                     if span_text:
                         line_text_parts.append(span_text)
-                        # Capture style from first span of the first line (block-level style)
-                        if block_style is None:
-                            font_name = span.get("font", "")
-                            font_size = span.get("size", 0)
-                            flags = span.get("flags", 0)
-                            block_style = StyleInfo(
-                                font_name=font_name,
-                                font_size=font_size,
-                                is_bold=bool(flags & 0x10),   # bit 4 = bold (PyMuPDF)
-                                is_italic=bool(flags & 0x02), # bit 1 = italic
-                                is_underline=False,           # underline not in fitz span flags
-                                color=self._color_to_hex(span.get("color", 0)),
-                            )
+                        # Remember the first span of the block (block-level style)
+                        if style_span is None:
+                            style_span = span
 
                 line_text = "".join(line_text_parts)
                 if line_text.strip():
@@ -257,6 +315,24 @@ class PyMuPDFParser(BaseParser):
             if len(para_text) < self.min_text_length:
                 continue
 
+            # Style is only built for blocks that survive the length filter.
+            block_style: Optional[StyleInfo] = None
+            if style_span is not None:
+                # Interned so every block in the document shares one str per
+                # font instead of a fresh copy per block.
+                flags = style_span.get("flags", 0)
+                color = style_span.get("color", 0)
+                if color not in color_hex:
+                    color_hex[color] = self._color_to_hex(color)
+                block_style = StyleInfo(
+                    font_name=sys.intern(style_span.get("font", "")),
+                    font_size=style_span.get("size", 0),
+                    is_bold=bool(flags & 0x10),   # bit 4 = bold (PyMuPDF)
+                    is_italic=bool(flags & 0x02), # bit 1 = italic
+                    is_underline=False,           # underline not in fitz span flags
+                    color=color_hex[color],
+                )
+
             # Union of all line bboxes → paragraph bbox
             xs0 = [b[0] for b in block_line_bboxes]
             ys0 = [b[1] for b in block_line_bboxes]
@@ -282,7 +358,7 @@ class PyMuPDFParser(BaseParser):
                     should_translate = False
 
             element = TranslatableElement(
-                element_id=f"p{page_num}_b{block_no}_{uuid.uuid4().hex[:8]}",
+                element_id=f"p{page_num}_b{block_no}_{_new_id_suffix()}",
                 content=para_text,
                 element_type=element_type,
                 page_num=page_num,
@@ -316,7 +392,7 @@ class PyMuPDFParser(BaseParser):
         try:
             # Get detailed text info (dict form)
             rect = fitz.Rect(bbox.x0, bbox.y0, bbox.x1, bbox.y1)
-            text_dict = page.get_text("dict", clip=rect)
+            text_dict = page.get_text("dict", clip=rect, flags=_TEXT_DICT_FLAGS)
 
             if not text_dict.get("blocks"):
                 return None
@@ -365,117 +441,30 @@ class PyMuPDFParser(BaseParser):
     ) -> None:
         """Detect tables and mark elements as table cells.
 
-        Uses PyMuPDF's built-in table detection.
+        Uses PyMuPDF's built-in table detection. parse() marks tables page by
+        page via _mark_page_tables; this applies the same to a whole document.
 
         Args:
             doc: PyMuPDF document object.
             elements: List of elements to update in-place.
         """
-        # Build page -> elements lookup
-        page_elements: Dict[int, List[TranslatableElement]] = {}
-        for elem in elements:
-            if elem.page_num not in page_elements:
-                page_elements[elem.page_num] = []
-            page_elements[elem.page_num].append(elem)
+        # Build page -> elements lookup.  parse() emits elements page by page,
+        # so the (stable) sort is a linear pass that only guards odd callers.
+        by_page = attrgetter("page_num")
+        page_elements: Dict[int, List[TranslatableElement]] = {
+            pg: list(group)
+            for pg, group in itertools.groupby(sorted(elements, key=by_page), key=by_page)
+        }
 
         table_counter = 0
         elements_changed = False
         for page_num in range(len(doc)):
-            page = doc[page_num]
-            try:
-                # find_tables() (default lines_strict strategy) with a
-                # BR-101 additive, sanity-gated looser-strategy fallback.
-                table_list = self._find_tables_with_fallback(page)
-                if not table_list:
-                    continue
-
-                for table in table_list:
-                    table_bbox = BoundingBox(
-                        x0=table.bbox[0],
-                        y0=table.bbox[1],
-                        x1=table.bbox[2],
-                        y1=table.bbox[3],
-                    )
-                    table_id = f"p{page_num + 1}_t{table_counter}"
-                    table_counter += 1
-
-                    # Map detected cell rects to (row, col) grid positions so the
-                    # translation layer can serialize the whole table as context
-                    # (table-context-translation for PDF).  Fail-soft: any error
-                    # degrades to the legacy in_table marking without grid coords.
-                    try:
-                        cell_grid = self._build_cell_grid(table)
-                    except Exception:
-                        cell_grid = []
-
-                    page_elems = page_elements.get(page_num + 1, [])
-                    inside = [
-                        elem for elem in page_elems
-                        if elem.bbox and self._is_inside(elem.bbox, table_bbox)
-                    ]
-
-                    # fitz text blocks frequently merge a whole table ROW into one
-                    # block.  When any element spans multiple cells, rebuild this
-                    # table's elements from span geometry so each grid cell becomes
-                    # its own element (correct translation unit AND overlay bbox).
-                    rebuilt: List[TranslatableElement] = []
-                    if cell_grid and inside and any(
-                        self._spans_multiple_cells(elem.bbox, cell_grid) for elem in inside
-                    ):
-                        try:
-                            rebuilt = self._split_elements_by_cells(
-                                page, page_num + 1, table_id, cell_grid
-                            )
-                        except Exception as exc:
-                            logger.debug(
-                                f"Per-cell split failed for {table_id}: {exc}; "
-                                "keeping merged elements."
-                            )
-                            rebuilt = []
-
-                    if rebuilt:
-                        inside_ids = {id(e) for e in inside}
-                        page_elems[:] = [
-                            e for e in page_elems if id(e) not in inside_ids
-                        ] + rebuilt
-                        page_elements[page_num + 1] = page_elems
-                        elements_changed = True
-                        continue
-
-                    # Mark elements inside table bbox as table cells
-                    for elem in inside:
-                        elem.element_type = ElementType.TABLE_CELL
-                        elem.metadata["in_table"] = True
-                        elem.metadata["table_id"] = table_id
-                        rc = self._locate_cell(elem.bbox, cell_grid)
-                        if rc is not None:
-                            elem.metadata["table_row"] = rc[0]
-                            elem.metadata["table_col"] = rc[1]
-                            # BR-102: correct the 1:1 block-to-cell bbox to the
-                            # true cell extent (right/bottom only — x0/y0 stay
-                            # at the tight text origin), mirroring the same
-                            # extension _split_elements_by_cells already
-                            # applies (:560-574) so translations longer than
-                            # the source text can use the cell's empty space
-                            # instead of being shrunk/truncated in the tight
-                            # source-text bbox. The pre-extension tight bbox is
-                            # preserved in metadata["lines"] (single-entry
-                            # list) for BR-84 bbox-exact whitening.
-                            cell_rect = next(
-                                (rect for ri, ci, rect in cell_grid if (ri, ci) == rc),
-                                None,
-                            )
-                            if cell_rect is not None and elem.bbox is not None:
-                                _pad = 2.0
-                                if "lines" not in elem.metadata:
-                                    elem.metadata["lines"] = [
-                                        (elem.bbox.x0, elem.bbox.y0, elem.bbox.x1, elem.bbox.y1)
-                                    ]
-                                elem.bbox.x1 = max(elem.bbox.x1, cell_rect[2] - _pad)
-                                elem.bbox.y1 = max(elem.bbox.y1, cell_rect[3] - _pad)
-
-            except Exception as e:
-                logger.debug(f"Table detection failed on page {page_num + 1}: {e}")
+            rebuilt, table_counter = self._mark_page_tables(
+                doc[page_num], page_num + 1, page_elements.get(page_num + 1, []), table_counter
+            )
+            if rebuilt is not None:
+                page_elements[page_num + 1] = rebuilt
+                elements_changed = True
 
         if elements_changed:
             # Rebuild the flat element list from the per-page lists (replaced
@@ -486,6 +475,129 @@ class PyMuPDFParser(BaseParser):
                 rebuilt_all.extend(page_elements[pg])
             elements[:] = rebuilt_all
 
+    def _mark_page_tables(
+        self,
+        page: Any,  # fitz.Page
+        page_num: int,
+        page_elems: List[TranslatableElement],
+        table_counter: int,
+        textpage: Any = None,  # fitz.TextPage
+    ) -> Tuple[Optional[List[TranslatableElement]], int]:
+        """Detect tables on one page and mark the page's elements as table cells.
+
+        Args:
+            page: PyMuPDF page object.
+            page_num: 1-based page number.
+            page_elems: Elements extracted from this page; marked in-place.
+            table_counter: Document-wide table counter (for table ids).
+            textpage: Pre-built TextPage for this page, reused by per-cell splits.
+
+        Returns:
+            Tuple of (replacement element list, or None when merged row-blocks
+            were not rebuilt into per-cell elements; updated table counter).
+        """
+        changed = False
+        try:
+            # find_tables() (default lines_strict strategy) with a
+            # BR-101 additive, sanity-gated looser-strategy fallback.
+            table_list = self._find_tables_with_fallback(page)
+            if not table_list:
+                return None, table_counter
+
+            by_top = _TopEdgeIndex(page_elems)
+            for table in table_list:
+                table_bbox = BoundingBox(
+                    x0=table.bbox[0],
+                    y0=table.bbox[1],
+                    x1=table.bbox[2],
+                    y1=table.bbox[3],
+                )
+                table_id = f"p{page_num}_t{table_counter}"
+                table_counter += 1
+
+                # Map detected cell rects to (row, col) grid positions so the
+                # translation layer can serialize the whole table as context
+                # (table-context-translation for PDF).  Fail-soft: any error
+                # degrades to the legacy in_table marking without grid coords.
+                try:
+                    cell_grid = self._build_cell_grid(table)
+                except Exception:
+                    cell_grid = []
+
+                # Only elements whose top edge falls in the table's vertical
+                # span can be inside it; the index narrows to those first.
+                inside = [
+                    elem for elem in by_top.candidates(
+                        table_bbox.y0 - _INSIDE_TOLERANCE_PT, table_bbox.y1 + _INSIDE_TOLERANCE_PT
+                    )
+                    if self._is_inside(elem.bbox, table_bbox)
+                ]
+
+                # fitz text blocks frequently merge a whole table ROW into one
+                # block.  When any element spans multiple cells, rebuild this
+                # table's elements from span geometry so each grid cell becomes
+                # its own element (correct translation unit AND overlay bbox).
+                rebuilt: List[TranslatableElement] = []
+                if cell_grid and inside and any(
+                    self._spans_multiple_cells(elem.bbox, cell_grid) for elem in inside
+                ):
+                    try:
+                        rebuilt = self._split_elements_by_cells(
+                            page, page_num, table_id, cell_grid, textpage=textpage
+                        )
+                    except Exception as exc:
+                        logger.debug(
+                            f"Per-cell split failed for {table_id}: {exc}; "
+                            "keeping merged elements."
+                        )
+                        rebuilt = []
+
+                if rebuilt:
+                    inside_ids = {id(e) for e in inside}
+                    page_elems = [
+                        e for e in page_elems if id(e) not in inside_ids
+                    ] + rebuilt
+                    by_top = _TopEdgeIndex(page_elems)
+                    changed = True
+                    continue
+
+                # Mark elements inside table bbox as table cells
+                for elem in inside:
+                    elem.element_type = ElementType.TABLE_CELL
+                    elem.metadata["in_table"] = True
+                    elem.metadata["table_id"] = table_id
+                    rc = self._locate_cell(elem.bbox, cell_grid)
+                    if rc is not None:
+                        elem.metadata["table_row"] = rc[0]
+                        elem.metadata["table_col"] = rc[1]
+                        # BR-102: correct the 1:1 block-to-cell bbox to the
+                        # true cell extent (right/bottom only — x0/y0 stay
+                        # at the tight text origin), mirroring the same
+                        # extension _split_elements_by_cells already
+                        # applies (:560-574) so translations longer than
+                        # the source text can use the cell's empty space
+                        # instead of being shrunk/truncated in the tight
+                        # source-text bbox. The pre-extension tight bbox is
+                        # preserved in metadata["lines"] (single-entry
+                        # list) for BR-84 bbox-exact whitening.
+                        cell_rect = next(
+                            (rect for ri, ci, rect in cell_grid if (ri, ci) == rc),
+                            None,
+                        )
+                        if cell_rect is not None and elem.bbox is not None:
+                            _pad = 2.0
+                            if "lines" not in elem.metadata:
+                                elem.metadata["lines"] = [
+                                    (elem.bbox.x0, elem.bbox.y0, elem.bbox.x1, elem.bbox.y1)
+                                ]
+                            elem.bbox.x1 = max(elem.bbox.x1, cell_rect[2] - _pad)
+                            elem.bbox.y1 = max(elem.bbox.y1, cell_rect[3] - _pad)
+
+        except Exception as e:
+            logger.debug(f"Table detection failed on page {page_num}: {e}")
+
+        return (page_elems if changed else None), table_counter
+
     def _find_tables_with_fallback(self, page: Any) -> List[Any]:
         """BR-101: additive, sanity-gated looser-strategy find_tables() fallback.
 
@@ -582,6 +694,7 @@ class PyMuPDFParser(BaseParser):
         page_num: int,
         table_id: str,
         cell_grid: List[Tuple[int, int, Tuple[float, float, float, float]]],
+        textpage: Any = None,  # fitz.TextPage
     ) -> List[TranslatableElement]:
         """Build one TranslatableElement per table cell from span geometry.
 
@@ -595,7 +708,7 @@ class PyMuPDFParser(BaseParser):
             table_id/table_row/table_col metadata).  Empty list when no spans
             land in any cell.
         """
-        text_dict = page.get_text("dict")
+        text_dict = page.get_text("dict", flags=_TEXT_DICT_FLAGS, textpage=textpage)
         spans_by_cell: Dict[Tuple[int, int], List[Tuple[tuple, str, dict]]] = {}
 
         for block in text_dict.get("blocks", []):
@@ -617,6 +730,7 @@ class PyMuPDFParser(BaseParser):
                             break
 
         rect_by_cell = {(ri, ci): rect for ri, ci, rect in cell_grid}
+        color_hex: Dict[int, str] = {}
 
         new_elements: List[TranslatableElement] = []
         for (ri, ci), spans in sorted(spans_by_cell.items()):
@@ -667,17 +781,20 @@ class PyMuPDFParser(BaseParser):
 
             first_span = line_groups[0][0][2]
             flags = first_span.get("flags", 0)
+            color = first_span.get("color", 0)
+            if color not in color_hex:
+                color_hex[color] = self._color_to_hex(color)
             style = StyleInfo(
-                font_name=first_span.get("font", ""),
+                font_name=sys.intern(first_span.get("font", "")),
                 font_size=first_span.get("size", 0),
                 is_bold=bool(flags & 0x10),
                 is_italic=bool(flags & 0x02),
                 is_underline=False,
-                color=self._color_to_hex(first_span.get("color", 0)),
+                color=color_hex[color],
             )
 
             new_elements.append(TranslatableElement(
-                element_id=f"p{page_num}_{table_id}_r{ri}c{ci}_{uuid.uuid4().hex[:8]}",
+                element_id=f"p{page_num}_{table_id}_r{ri}c{ci}_{_new_id_suffix()}",
                 content=content,
                 element_type=ElementType.TABLE_CELL,
                 page_num=page_num,
@@ -750,7 +867,7 @@ class PyMuPDFParser(BaseParser):
 
     def _is_inside(self, inner: BoundingBox, outer: BoundingBox) -> bool:
         """Check if inner bbox is inside outer bbox (with tolerance)."""
-        tolerance = 5.0  # points
+        tolerance = _INSIDE_TOLERANCE_PT
         return (
             inner.x0 >= outer.x0 - tolerance
             and inner.y0 >= outer.y0 - tolerance
@@ -1020,19 +1137,23 @@ class PyMuPDFParser(BaseParser):
             DocumentMetadata object.
         """
         meta = doc.metadata or {}
+        title, author, subject, creator, producer, created, modified = map(
+            meta.get,
+            ("title", "author", "subject", "creator", "producer", "creationDate", "modDate"),
+        )
 
         # Determine if document has meaningful text layer
         # Heuristic: less than 20 chars per page suggests scanned PDF
         has_text_layer = (total_chars / max(page_count, 1)) >= 20
 
         return DocumentMetadata(
-            title=meta.get("title"),
-            author=meta.get("author"),
-            subject=meta.get("subject"),
-            creator=meta.get("creator"),
-            producer=meta.get("producer"),
-            creation_date=meta.get("creationDate"),
-            modification_date=meta.get("modDate"),
+            title=title,
+            author=author,
+            subject=subject,
+            creator=creator,
+            producer=producer,
+            creation_date=created,
+            modification_date=modified,
             page_count=page_count,
             has_text_layer=has_text_layer,
         )
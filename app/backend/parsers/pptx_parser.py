@@ -6,10 +6,11 @@ information into a TranslatableDocument format.
 
 from __future__ import annotations
 
+import itertools
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, List, Optional, Set
+from typing import Any, Hashable, List, Optional, Set, Tuple
 
 import pptx
 from pptx.shapes.base import BaseShape
@@ -30,6 +31,39 @@ from app.backend.utils.text_utils import should_translate
 
 logger = logging.getLogger(__name__)
 
+# Convert EMU to points (1 inch = 914400 EMU, 1 inch = 72 points)
+_EMU_TO_PT = 72.0 / 914400.0
+
+# Element id suffixes: one random prefix per process plus a shared counter.
+# next() on itertools.count is atomic under the GIL, so a parser instance
+# shared across jobs still hands out unique ids without a urandom call each.
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_ID_COUNTER = itertools.count()
+
+
+def _new_id_suffix() -> str:
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):08x}"
+
+
+def resolve_shape(prs: Any, shape_path: Tuple[int, Tuple[int, ...]]) -> BaseShape:
+    """Look up the shape an element was extracted from.
+
+    Args:
+        prs: The ``pptx.Presentation`` the document was parsed from.
+        shape_path: ``metadata["shape_path"]``: 0-based slide index and the
+            shape's index at each level of the slide's (group) shape tree.
+
+    Returns:
+        The shape; for table cells, index ``shape.table.cell(row - 1, col - 1)``.
+    """
+    slide_idx, idx_path = shape_path
+    shapes = prs.slides[slide_idx].shapes
+    shape = None
+    for idx in idx_path:
+        shape = shapes[idx]
+        shapes = getattr(shape, "shapes", None)
+    return shape
+
 
 class PptxParser(BaseParser):
     """Parser for PPTX presentations.
@@ -79,7 +113,7 @@ class PptxParser(BaseParser):
         prs = pptx.Presentation(file_path)
 
         elements: List[TranslatableElement] = []
-        seen_keys: Set[str] = set()
+        seen_keys: Set[Hashable] = set()
         total_text_length = 0
         pages: List[PageInfo] = []
 
@@ -139,7 +173,7 @@ class PptxParser(BaseParser):
         self,
         slide: Slide,
         slide_num: int,
-        seen_keys: Set[str],
+        seen_keys: Set[Hashable],
         slide_width: float,
         slide_height: float,
     ) -> List[TranslatableElement]:
@@ -157,9 +191,9 @@ class PptxParser(BaseParser):
         """
         elements: List[TranslatableElement] = []
 
-        for shape in slide.shapes:
+        for shape_idx, shape in enumerate(slide.shapes):
             shape_elements = self._extract_from_shape(
-                shape, slide_num, seen_keys, slide_width, slide_height
+                shape, slide_num, seen_keys, slide_width, slide_height, (shape_idx,)
             )
             elements.extend(shape_elements)
 
@@ -169,9 +203,10 @@ class PptxParser(BaseParser):
         self,
         shape: BaseShape,
         slide_num: int,
-        seen_keys: Set[str],
+        seen_keys: Set[Hashable],
         slide_width: float,
         slide_height: float,
+        shape_idx_path: Tuple[int, ...] = (),
     ) -> List[TranslatableElement]:
         """Extract elements from a shape.
 
@@ -181,6 +216,8 @@ class PptxParser(BaseParser):
             seen_keys: Set of already-seen text keys.
             slide_width: Slide width in points.
             slide_height: Slide height in points.
+            shape_idx_path: Index of the shape within the slide's shape tree
+                (one entry per group level); see resolve_shape().
 
         Returns:
             List of extracted elements.
@@ -190,9 +227,10 @@ class PptxParser(BaseParser):
         # Handle grouped shapes
         if shape.shape_type == 6:  # MSO_SHAPE_TYPE.GROUP
             if hasattr(shape, "shapes"):
-                for child_shape in shape.shapes:
+                for child_idx, child_shape in enumerate(shape.shapes):
                     child_elements = self._extract_from_shape(
-                        child_shape, slide_num, seen_keys, slide_width, slide_height
+                        child_shape, slide_num, seen_keys, slide_width, slide_height,
+                        shape_idx_path + (child_idx,),
                     )
                     elements.extend(child_elements)
             return elements
@@ -200,7 +238,7 @@ class PptxParser(BaseParser):
         # Handle tables
         if hasattr(shape, "table"):
             table_elements = self._extract_from_table(
-                shape, slide_num, seen_keys
+                shape, slide_num, seen_keys, shape_idx_path
             )
             elements.extend(table_elements)
             return elements
@@ -220,7 +258,7 @@ class PptxParser(BaseParser):
             return elements
 
         # Generate key for deduplication
-        key = f"pptx_{slide_num}_{hash(text)}_{len(text)}"
+        key = ("shape", slide_num, text)
         if key in seen_keys:
             return elements
         seen_keys.add(key)
@@ -233,7 +271,7 @@ class PptxParser(BaseParser):
 
         elements.append(
             TranslatableElement(
-                element_id=f"pptx_{uuid.uuid4().hex[:8]}",
+                element_id=f"pptx_{_new_id_suffix()}",
                 content=text,
                 element_type=element_type,
                 page_num=slide_num,
@@ -242,7 +280,9 @@ class PptxParser(BaseParser):
                 metadata={
                     "shape_type": shape.shape_type,
                     "shape_name": shape.name if hasattr(shape, "name") else None,
-                    "text_frame_ref": tf,  # Keep reference for rendering
+                    # Locator, not a live reference: keeps the presentation
+                    # tree collectable (see resolve_shape)
+                    "shape_path": (slide_num - 1, shape_idx_path),
                 },
             )
         )
@@ -253,7 +293,8 @@ class PptxParser(BaseParser):
         self,
         shape: BaseShape,
         slide_num: int,
-        seen_keys: Set[str],
+        seen_keys: Set[Hashable],
+        shape_idx_path: Tuple[int, ...] = (),
     ) -> List[TranslatableElement]:
         """Extract elements from a table shape.
 
@@ -261,6 +302,7 @@ class PptxParser(BaseParser):
             shape: Table shape object.
             slide_num: Slide number.
             seen_keys: Set of already-seen text keys.
+            shape_idx_path: Index path of the table shape; see resolve_shape().
 
         Returns:
             List of extracted elements.
@@ -277,14 +319,14 @@ class PptxParser(BaseParser):
                 if not should_translate(text, "auto"):
                     continue
 
-                key = f"pptx_tbl_{slide_num}_{row_idx}_{col_idx}_{hash(text)}"
+                key = ("cell", slide_num, row_idx, col_idx, text)
                 if key in seen_keys:
                     continue
                 seen_keys.add(key)
 
                 elements.append(
                     TranslatableElement(
-                        element_id=f"pptx_cell_{uuid.uuid4().hex[:8]}",
+                        element_id=f"pptx_cell_{_new_id_suffix()}",
                         content=text,
                         element_type=ElementType.TABLE_CELL,
                         page_num=slide_num,
@@ -293,7 +335,7 @@ class PptxParser(BaseParser):
                             "in_table": True,
                             "row": row_idx + 1,
                             "col": col_idx + 1,
-                            "cell_ref": cell,  # Keep reference for rendering
+                            "shape_path": (slide_num - 1, shape_idx_path),
                         },
                     )
                 )
@@ -309,7 +351,9 @@ class PptxParser(BaseParser):
         Returns:
             Text content with paragraph breaks.
         """
-        return "\n".join(p.text for p in tf.paragraphs)
+        # Read the a:p elements directly: same text as tf.paragraphs (runs and
+        # fields joined, a:br as "\v") without building a _Paragraph proxy each.
+        return "\n".join(p.text for p in tf._txBody.p_lst)
 
     def _get_shape_bbox(self, shape: BaseShape) -> Optional[BoundingBox]:
         """Get bounding box from shape position.
@@ -321,13 +365,11 @@ class PptxParser(BaseParser):
             BoundingBox or None if position unavailable.
         """
         try:
-            # Convert EMU to points (1 inch = 914400 EMU, 1 inch = 72 points)
-            emu_to_pt = 72.0 / 914400.0
-
-            left = shape.left * emu_to_pt if shape.left else 0
-            top = shape.top * emu_to_pt if shape.top else 0
-            width = shape.width * emu_to_pt if shape.width else 0
-            height = shape.height * emu_to_pt if shape.height else 0
+            # One read per position property; unset (None) positions count as 0.
+            left, top, width, height = (
+                (v or 0) * _EMU_TO_PT
+                for v in (shape.left, shape.top, shape.width, shape.height)
+            )
 
             return BoundingBox(
                 x0=left,
@@ -327,7 +327,14 @@ class JobManager:
         enable_term_extraction: bool = True,
         output_mode: str = "append",
         api_key_override: Optional[str] = None,
+        take_ownership: bool = False,
     ) -> JobRecord:
+        """Create a job and start its worker thread.
+
+        With ``take_ownership=True`` the uploaded files are moved (a rename
+        when they already live on the JOBS_DIR filesystem) into the job's
+        input dir instead of copied, leaving the caller nothing to delete.
+        """
         # Cleanup by capacity before creating new job
         self._cleanup_by_capacity()
 
@@ -341,7 +348,10 @@ class JobManager:
         stored_files: List[Path] = []
         for src in uploaded_files:
             dest = input_dir / src.name
-            shutil.copy2(src, dest)
+            if take_ownership:
+                shutil.move(str(src), dest)
+            else:
+                shutil.copy2(src, dest)
             stored_files.append(dest)
 
         job = JobRecord(job_id=job_id, input_dir=input_dir, output_dir=output_dir, mode=mode, api_key_override=api_key_override)
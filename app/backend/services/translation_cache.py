@@ -1,6 +1,7 @@
 """Persistent SQLite translation cache.
 
-Caches translation results keyed by sha256(source_text, target_lang, src_lang, model).
+Caches translation results keyed by a 16-byte BLAKE2b digest of
+(source_text, target_lang, src_lang, model).
 Cache hits bypass Ollama entirely, dramatically speeding up repeated translations.
 """
 
@@ -9,80 +10,220 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
-import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from app.backend.config import CACHE_DIR, TRANSLATION_CACHE_ENABLED
+try:
+    # pysqlite3-binary bundles a current SQLite engine (newer query planner,
+    # PRAGMA optimize, WAL fixes) independent of the distro's libsqlite3. It is
+    # a drop-in DB-API replacement; fall back to the stdlib driver where no
+    # wheel exists (e.g. Windows).
+    import pysqlite3.dbapi2 as sqlite3  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    import sqlite3
+
+from app.backend.config import (
+    CACHE_DIR,
+    TRANSLATION_CACHE_ENABLED,
+    TRANSLATION_CACHE_MEMORY_ENTRIES,
+)
 
 logger = logging.getLogger(__name__)
 
-_SCHEMA_VERSION = 1
+# v1 keyed rows by a 64-char sha256 hex TEXT; v2 uses a 16-byte BLAKE2b BLOB,
+# shrinking the primary-key index ~4x. v1 files are migrated in place.
+_SCHEMA_VERSION = 2
 _VAR_CHUNK_SIZE = 900  # SQLite variable limit safety margin
 
+# Applied once per pooled connection. page_size only takes effect on a fresh
+# database file (before the first table is created), so it must run before
+# journal_mode=WAL; on an existing file it is a harmless no-op. Busy waiting is
+# handled by sqlite3.connect(timeout=10), so busy_timeout is not repeated here.
+_CONNECTION_PRAGMAS = """
+    PRAGMA page_size=32768;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# The WAL is truncated at most this often, piggy-backed on a write, which
+# bounds its on-disk size without a dedicated timer thread.
+_WAL_CHECKPOINT_INTERVAL_S = 15 * 60
+
+# Hot-path SQL lives in module constants so every call passes the identical
+# string and hits sqlite3's per-connection compiled-statement cache instead
+# of re-preparing. get_batch's IN-list varies only by chunk length, so one
+# statement text exists per chunk size and the common sizes stay cached.
+_STATEMENT_CACHE_SIZE = 256
+_SQL_CREATE_TRANSLATIONS = """
+    CREATE TABLE IF NOT EXISTS translations (
+        key_hash    BLOB PRIMARY KEY,
+        source_text TEXT NOT NULL,
+        target_lang TEXT NOT NULL,
+        src_lang    TEXT NOT NULL,
+        model       TEXT NOT NULL,
+        translation TEXT NOT NULL,
+        created_at  REAL NOT NULL
+    )
+"""
+_SQL_SELECT_BY_KEYS = "SELECT key_hash, translation FROM translations WHERE key_hash IN ({placeholders})"
+_SQL_INSERT = (
+    "INSERT OR IGNORE INTO translations "
+    "(key_hash, source_text, target_lang, src_lang, model, translation, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
 
-def _make_key(text: str, target_lang: str, src_lang: str, model: str) -> str:
-    """Compute cache key as sha256 hex digest."""
+
+def _make_key(text: str, target_lang: str, src_lang: str, model: str) -> bytes:
+    """Compute cache key as a 16-byte BLAKE2b digest."""
     payload = "\x00".join([
         text.strip(),
         target_lang.lower(),
         src_lang.lower(),
         model.lower(),
     ])
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
 
 
 class TranslationCache:
-    """Thread-safe SQLite translation cache with WAL mode."""
+    """Thread-safe SQLite translation cache with WAL mode and tuned PRAGMAs."""
 
-    def __init__(self, db_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        memory_entries: int = TRANSLATION_CACHE_MEMORY_ENTRIES,
+    ) -> None:
         self._db_path = db_path or (CACHE_DIR / "translations.db")
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._local = threading.local()
         self._init_lock = threading.Lock()
+        # Every pooled connection, across all threads, so close() can reach them.
+        self._conns: List[sqlite3.Connection] = []
+        # Bumped by close(); thread-local connections from an older generation
+        # are stale and get reopened on next use.
+        self._generation = 0
+        self._schema_ready = False
+        # Bounded in-process LRU (key -> translation) in front of SQLite, so
+        # repeated lookups are a dict hit instead of a B-tree descent. It only
+        # ever holds values known to match the database row.
+        self._memory_entries = max(memory_entries, 0)
+        self._memory: "OrderedDict[bytes, str]" = OrderedDict()
+        self._memory_lock = threading.Lock()
         # Eagerly create schema on the calling thread
         self._get_conn()
+        self._last_checkpoint = time.monotonic()
         logger.info("Translation cache initialized: %s", self._db_path)
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Return a thread-local SQLite connection, creating if needed."""
+        """Return a thread-local SQLite connection, creating if needed.
+
+        Each worker thread keeps one long-lived connection; PRAGMAs and the
+        schema check run once per connection (schema once per instance), not
+        once per operation.
+        """
         conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
-        if conn is None:
-            conn = sqlite3.connect(str(self._db_path), timeout=10)
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            self._local.conn = conn
-            self._ensure_schema(conn)
+        if conn is not None and self._local.generation == self._generation:
+            return conn
+
+        # check_same_thread=False only so close() may close connections owned
+        # by other threads at shutdown; each connection is still used by the
+        # thread that opened it.
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=10,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.executescript(_CONNECTION_PRAGMAS)
+        with self._init_lock:
+            if not self._schema_ready:
+                self._ensure_schema(conn)
+                self._schema_ready = True
+            self._conns.append(conn)
+            self._local.generation = self._generation
+        self._local.conn = conn
         return conn
 
+    def _checkpoint_if_due(self, conn: sqlite3.Connection) -> None:
+        """Truncate the WAL if the last checkpoint is older than the interval."""
+        now = time.monotonic()
+        with self._init_lock:
+            if now - self._last_checkpoint < _WAL_CHECKPOINT_INTERVAL_S:
+                return
+            self._last_checkpoint = now
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as exc:
+            logger.debug("WAL checkpoint skipped: %s", exc)
+
+    def close(self) -> None:
+        """Close every pooled connection (all threads).
+
+        Runs ``PRAGMA optimize`` first so the query planner statistics are
+        refreshed for the next process. The cache stays usable: a thread
+        touching it afterwards transparently opens a fresh connection.
+        """
+        with self._init_lock:
+            conns, self._conns = self._conns, []
+            self._generation += 1
+        if conns:
+            try:
+                conns[0].execute("PRAGMA optimize")
+            except sqlite3.Error as exc:
+                logger.debug("PRAGMA optimize skipped: %s", exc)
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error as exc:
+                logger.debug("Error closing cache connection: %s", exc)
+
     def _ensure_schema(self, conn: sqlite3.Connection) -> None:
-        """Create tables if they don't exist."""
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS translations (
-                key_hash    TEXT PRIMARY KEY,
-                source_text TEXT NOT NULL,
-                target_lang TEXT NOT NULL,
-                src_lang    TEXT NOT NULL,
-                model       TEXT NOT NULL,
-                translation TEXT NOT NULL,
-                created_at  REAL NOT NULL
-            )
-        """)
+        """Create tables if they don't exist, migrating older key layouts."""
         conn.execute("""
             CREATE TABLE IF NOT EXISTS cache_meta (
                 key   TEXT PRIMARY KEY,
                 value TEXT NOT NULL
             )
         """)
-        # Store schema version
+        row = conn.execute(
+            "SELECT value FROM cache_meta WHERE key = 'schema_version'"
+        ).fetchone()
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'translations'"
+        ).fetchone() is not None
+        if has_table and (row is None or int(row[0]) < 2):
+            self._migrate_v1_keys(conn)
+        conn.execute(_SQL_CREATE_TRANSLATIONS)
         conn.execute(
-            "INSERT OR IGNORE INTO cache_meta (key, value) VALUES (?, ?)",
+            "INSERT OR REPLACE INTO cache_meta (key, value) VALUES (?, ?)",
             ("schema_version", str(_SCHEMA_VERSION)),
         )
         conn.commit()
 
+    def _migrate_v1_keys(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a v1 (sha256 hex TEXT key) table under v2 BLOB keys.
+
+        Every column the key is derived from is stored on the row, so keys are
+        recomputed in SQL via a registered function; no entry is lost.
+        """
+        conn.create_function("cache_key", 4, _make_key, deterministic=True)
+        conn.execute("ALTER TABLE translations RENAME TO translations_v1")
+        conn.execute(_SQL_CREATE_TRANSLATIONS)
+        conn.execute("""
+            INSERT OR IGNORE INTO translations
+                (key_hash, source_text, target_lang, src_lang, model, translation, created_at)
+            SELECT cache_key(source_text, target_lang, src_lang, model),
+                   source_text, target_lang, src_lang, model, translation, created_at
+            FROM translations_v1
+        """)
+        conn.execute("DROP TABLE translations_v1")
+        logger.info("Translation cache migrated to schema v%d (binary keys)", _SCHEMA_VERSION)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -102,34 +243,49 @@ class TranslationCache:
         if not texts:
             return {}
 
-        key_to_text: Dict[str, str] = {}
+        key_to_text: Dict[bytes, str] = {}
         for t in texts:
             k = _make_key(t, target_lang, src_lang, model)
             key_to_text[k] = t
 
-        conn = self._get_conn()
         result: Dict[str, str] = {}
-        keys = list(key_to_text.keys())
+        keys: List[bytes] = []
+        with self._memory_lock:
+            for k, t in key_to_text.items():
+                translation = self._memory.get(k)
+                if translation is None:
+                    keys.append(k)
+                else:
+                    self._memory.move_to_end(k)
+                    result[t] = translation
+        if not keys:
+            return result
+
+        conn = self._get_conn()
+        db_hits: Dict[bytes, str] = {}
 
         # Query in chunks to stay within SQLite variable limit
         for i in range(0, len(keys), _VAR_CHUNK_SIZE):
             chunk = keys[i : i + _VAR_CHUNK_SIZE]
             placeholders = ",".join("?" * len(chunk))
             rows = conn.execute(
-                f"SELECT key_hash, translation FROM translations WHERE key_hash IN ({placeholders})",
+                _SQL_SELECT_BY_KEYS.format(placeholders=placeholders),
                 chunk,
             ).fetchall()
             for key_hash, translation in rows:
-                src_text = key_to_text[key_hash]
-                result[src_text] = translation
+                db_hits[key_hash] = translation
+                result[key_to_text[key_hash]] = translation
 
+        self._remember(db_hits)
         return result
 
     def put_batch(
         self,
         entries: List[Tuple[str, str, str, str, str]],
     ) -> None:
-        """Store multiple translation results.
+        """Store multiple translation results in a single transaction.
+
+        Prefer this over repeated put() calls: each call costs one commit.
 
         Args:
             entries: List of (source_text, target_lang, src_lang, model, translation).
@@ -146,13 +302,21 @@ class TranslationCache:
                 key_hash, source_text, target_lang, src_lang, model, translation, now,
             ))
 
-        conn.executemany(
-            """INSERT OR IGNORE INTO translations
-               (key_hash, source_text, target_lang, src_lang, model, translation, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            rows,
-        )
+        # BEGIN IMMEDIATE takes the write lock up front: one fsync for the whole
+        # batch, and no deferred read->write lock upgrade that could hit
+        # SQLITE_BUSY mid-batch when several job threads flush at once.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.executemany(_SQL_INSERT, rows)
+        except BaseException:
+            conn.rollback()
+            raise
         conn.commit()
+        # INSERT OR IGNORE keeps an existing row, so the new values are only
+        # authoritative when every row was actually inserted.
+        if cursor.rowcount == len(rows):
+            self._remember({row[0]: row[5] for row in rows})
+        self._checkpoint_if_due(conn)
 
     def put(
         self,
@@ -181,6 +345,7 @@ class TranslationCache:
             cursor = conn.execute("DELETE FROM translations")
         conn.commit()
         deleted = cursor.rowcount
+        self._forget_all()
         if deleted > 0:
             conn.execute("VACUUM")
         logger.info("Cache cleared: %d entries deleted (model=%s)", deleted, model or "all")
@@ -216,11 +381,28 @@ class TranslationCache:
             cursor = conn.execute(f"DELETE FROM translations WHERE {empty_clause}")
         conn.commit()
         deleted = cursor.rowcount
+        self._forget_all()
         if deleted > 0:
             conn.execute("VACUUM")
         logger.info("Cache purged empty entries: %d deleted (model=%s)", deleted, model or "all")
         return deleted
 
+    def _remember(self, entries: Dict[bytes, str]) -> None:
+        """Insert entries into the in-process LRU, evicting the oldest."""
+        if not entries or not self._memory_entries:
+            return
+        with self._memory_lock:
+            for key, translation in entries.items():
+                self._memory[key] = translation
+                self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_entries:
+                self._memory.popitem(last=False)
+
+    def _forget_all(self) -> None:
+        """Drop the in-process LRU after rows were deleted from SQLite."""
+        with self._memory_lock:
+            self._memory.clear()
+
     def stats(self) -> Dict:
         """Return cache statistics."""
         conn = self._get_conn()
@@ -263,3 +445,10 @@ def get_cache() -> Optional[TranslationCache]:
         if _cache_instance is None:
             _cache_instance = TranslationCache()
         return _cache_instance
+
+
+def close_cache() -> None:
+    """Close the global cache's pooled connections, if it was ever created."""
+    with _cache_lock:
+        if _cache_instance is not None:
+            _cache_instance.close()
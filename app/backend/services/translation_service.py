@@ -627,16 +627,20 @@ def translate_texts(
                     )
 
         _critique_iter_count = 0
+        _critique_cache_entries: List[Tuple[str, str, str, str, str]] = []
         for _key in _pending_keys:
             tmap[_key] = _current_draft[_key]
             _critique_iter_count += _segment_iters[_key]
             _tgt, _src_text = _key
-            # Persist the critique-approved result for future runs.
-            if cache is not None:
-                try:
-                    cache.put(_src_text, _tgt, src_lang or "auto", _critique_model_key, _current_draft[_key])
-                except Exception:
-                    pass  # cache write must never break translation
+            _critique_cache_entries.append(
+                (_src_text, _tgt, src_lang or "auto", _critique_model_key, _current_draft[_key])
+            )
+        # Persist the critique-approved results for future runs in one transaction.
+        if cache is not None and _critique_cache_entries:
+            try:
+                cache.put_batch(_critique_cache_entries)
+            except Exception:
+                pass  # cache write must never break translation
 
         if status_callback is not None:
             status_callback(None)
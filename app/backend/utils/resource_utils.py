@@ -8,6 +8,7 @@ from typing import Callable, Optional
 
 from app.backend.clients.base_llm_client import LLMClient
 from app.backend.clients.ollama_client import OllamaClient
+from app.backend.services.translation_cache import close_cache
 from app.backend.utils.logging_utils import logger
 
 
@@ -51,7 +52,8 @@ def release_resources(
 def full_shutdown_cleanup() -> None:
     """Perform full cleanup on application shutdown.
 
-    This closes shared resources like HTTP connection pools.
+    This closes shared resources like HTTP connection pools and the
+    translation cache's SQLite connections.
     Should only be called during application shutdown.
     """
     logger.info("Performing full shutdown cleanup")
@@ -63,6 +65,13 @@ def full_shutdown_cleanup() -> None:
     except Exception as exc:
         logger.error("Error closing HTTP session: %s", exc)
 
+    # Close pooled translation-cache connections
+    try:
+        close_cache()
+        logger.info("Closed translation cache connections")
+    except Exception as exc:
+        logger.error("Error closing translation cache: %s", exc)
+
     # Force garbage collection
     try:
         collected = gc.collect()
@@ -47,9 +47,17 @@ def normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", (text or "").strip()).lower()
 
 
+# CJK Unified Ideographs. search() stops at the first hit inside the C regex
+# engine instead of iterating code points in Python.
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
+# Numbers with punctuation, e.g. "5.", "1.4", "-10", "3,900".
+_NUMBER_RE = re.compile(r'^[-+]?\d+([.,]\d+)*[.]?$')
+
+
 def has_cjk(text: str) -> bool:
     """Check if text contains CJK characters."""
-    return any("\u4e00" <= ch <= "\u9fff" for ch in (text or ""))
+    return _CJK_RE.search(text or "") is not None
 
 
 def count_composition(text: str) -> tuple[int, int]:
@@ -134,8 +142,7 @@ def should_translate(text: Any, source_lang: str) -> bool:
 
     # Check if text is a number with punctuation (e.g., "5.", "1.4", "-10", "3,900")
     # Pattern: optional minus, digits, optional decimal/comma with more digits
-    number_pattern = re.compile(r'^[-+]?\d+([.,]\d+)*[.]?$')
-    if number_pattern.match(text_str):
+    if _NUMBER_RE.match(text_str):
         return False
 
     # Extract only letters (alphabetic characters)
@@ -403,7 +403,23 @@ class BatchTranslator:
             return
         texts: List[str] = [text for text, _ in self._pending]
         total_chars = self._pending_chars
-        if hasattr(self.client, "translate_batch"):
+        if hasattr(self.client, "translate_batch_outcomes"):
+            # Per-segment outcomes: the client already retried what its batch
+            # reply lost, so failed slots are recorded rather than re-sent.
+            outcomes = self.client.translate_batch_outcomes(
+                texts, self.tgt, self.src_lang, cancel_event=self._stop_flag,
+            )
+            failed = 0
+            for (text, idx), (ok, ans) in zip(self._pending, outcomes):
+                if not ok:
+                    failed += 1
+                    ans = f"[Translation failed|{self.tgt}] {text}"
+                self._results[idx] = (ok, ans)
+            if failed:
+                logger.warning("Batch translation: %s/%s segments failed", failed, len(texts))
+            else:
+                logger.debug("Batch translation succeeded: %s segments, %s chars", len(texts), total_chars)
+        elif hasattr(self.client, "translate_batch"):
             ok, results = self.client.translate_batch(texts, self.tgt, self.src_lang)
             if ok and len(results) == len(texts):
                 for i, (text, idx) in enumerate(self._pending):
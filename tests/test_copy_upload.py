@@ -0,0 +1,35 @@
+"""Tests for routes._copy_upload: chunked copy of spooled uploads to disk.
+
+Mock seam: none — real files under tmp_path.
+"""
+
+from __future__ import annotations
+
+import tempfile
+
+from starlette.datastructures import UploadFile
+
+from app.backend.api import routes
+
+
+def test_rolled_spooled_upload_lands_intact(tmp_path, monkeypatch):
+    monkeypatch.setattr(routes, "_UPLOAD_CHUNK_SIZE", 16)
+    spool = tempfile.SpooledTemporaryFile(max_size=4, dir=tmp_path)
+    spool.write(b"x" * 64)
+    spool.seek(0)
+    dest = tmp_path / "big.pdf"
+
+    routes._copy_upload(UploadFile(spool, filename="big.pdf"), dest)
+
+    assert dest.read_bytes() == b"x" * 64
+
+
+def test_in_memory_upload_is_copied(tmp_path):
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(b"small")
+    spool.seek(0)
+    dest = tmp_path / "small.txt"
+
+    routes._copy_upload(UploadFile(spool, filename="small.txt"), dest)
+
+    assert dest.read_bytes() == b"small"
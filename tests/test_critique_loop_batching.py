@@ -292,6 +292,14 @@ def test_cached_segments_excluded_from_round_batch():
     blocks = mock_sb.call_args[0][1]
     assert blocks == [("Seg A", "Draft A"), ("Seg A", "Revised A")]
 
+    # Critique results are persisted in one batched transaction, not per segment.
+    cache.put.assert_not_called()
+    critique_writes = [
+        c.args[0] for c in cache.put_batch.call_args_list
+        if c.args[0] and c.args[0][0][3].endswith(":c")
+    ]
+    assert critique_writes == [[("Seg A", "fr", "en", client.cache_model_key + ":c", "Revised A")]]
+
 
 # ---------------------------------------------------------------------------
 # AC-5: per-segment exception isolation within a round.
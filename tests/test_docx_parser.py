@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -10,6 +11,7 @@ import pytest
 
 from app.backend.models.translatable_document import ElementType
 from app.backend.parsers.docx_parser import DocxParser
+from app.backend.utils.exceptions import DocumentSizeLimitExceeded
 
 
 class TestDocxParser:
@@ -131,9 +133,8 @@ class TestDocxParser:
             result = parser.parse(temp_path)
             contents = [e.content for e in result.elements]
 
-            # Duplicates should be filtered (based on key generation)
-            # The exact count depends on key uniqueness logic
-            assert "Same text" in contents
+            # Duplicates are filtered by their extracted text
+            assert contents.count("Same text") == 1
             assert "Different text" in contents
         finally:
             Path(temp_path).unlink(missing_ok=True)
@@ -159,6 +160,90 @@ class TestDocxParser:
         finally:
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_breaks_and_tabs_become_whitespace(self, parser, tmp_path):
+        """w:br maps to a newline and w:tab to a space in extracted text."""
+        doc = docx.Document()
+        p = doc.add_paragraph()
+        p.add_run("Line one")
+        p.add_run().add_break()
+        p.add_run("Line\ttwo")
+        path = tmp_path / "breaks.docx"
+        doc.save(str(path))
+
+        result = parser.parse(str(path))
+
+        assert [e.content for e in result.elements] == ["Line one\nLine two"]
+
+    def test_parsed_document_is_json_serializable(self, parser, table_docx):
+        """Elements point at XML nodes by index, so to_dict() is plain JSON."""
+        result = parser.parse(table_docx)
+
+        json.dumps(result.to_dict())
+        for elem in result.elements:
+            node = parser.paragraph_refs[elem.metadata["paragraph_idx"]]
+            assert elem.content in "".join(node.itertext())
+
+    def test_segment_limit_stops_extraction_early(self, tmp_path):
+        """The size limit is enforced while extracting, not after the whole walk."""
+        doc = docx.Document()
+        for i in range(10):
+            doc.add_paragraph(f"Paragraph {i}")
+        path = tmp_path / "big.docx"
+        doc.save(str(path))
+        parser = DocxParser(max_segments=3)
+
+        with pytest.raises(DocumentSizeLimitExceeded) as exc_info:
+            parser.parse(str(path))
+
+        assert exc_info.value.segment_count == 4
+        assert len(parser.paragraph_refs) == 4
+
+    def test_textbox_text_extracted(self, parser, tmp_path):
+        """Paragraphs inside w:txbxContent become TextBox elements, one line each."""
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+
+        doc = docx.Document()
+        doc.add_paragraph("Body text")
+        run = doc.add_paragraph().add_run()
+        run._r.append(parse_xml(
+            f'<w:pict {nsdecls("w")} xmlns:v="urn:schemas-microsoft-com:vml">'
+            "<v:shape><v:textbox><w:txbxContent>"
+            "<w:p><w:r><w:t>Box line one</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>  </w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>Box line two</w:t></w:r></w:p>"
+            "</w:txbxContent></v:textbox></v:shape></w:pict>"
+        ))
+        path = tmp_path / "textbox.docx"
+        doc.save(str(path))
+
+        result = parser.parse(str(path))
+        boxes = [e for e in result.elements if e.metadata["context"] == "TextBox"]
+
+        assert [e.content for e in boxes] == ["Box line one\nBox line two"]
+        assert parser.textbox_refs[boxes[0].metadata["textbox_idx"]].tag.endswith("}txbxContent")
+
+    def test_content_control_paragraphs_resolve_styles(self, parser, tmp_path):
+        """Paragraphs inside a leading w:sdt can reach the styles part."""
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+
+        doc = docx.Document()
+        doc.element.body.insert(0, parse_xml(
+            f"<w:sdt {nsdecls('w')}><w:sdtPr/><w:sdtContent>"
+            '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+            "<w:r><w:t>Inside control</w:t></w:r></w:p>"
+            "</w:sdtContent></w:sdt>"
+        ))
+        path = tmp_path / "sdt.docx"
+        doc.save(str(path))
+
+        result = parser.parse(str(path))
+
+        assert result.elements[0].content == "Inside control"
+        assert result.elements[0].metadata["context"] == "Body > SDT"
+        assert result.elements[0].element_type == ElementType.TITLE
+
     def test_element_ids_unique(self, parser, simple_docx):
         """Test that element IDs are unique."""
         doc = parser.parse(simple_docx)
@@ -0,0 +1,65 @@
+"""Tests for JobManager.create_job(take_ownership=...) upload handling.
+
+Runs the REAL create_job path with `process_files` faked at the boundary, so
+the job worker completes without touching any processor.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+
+def _wait_for_job(job, timeout: float = 10.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if job.status in ("completed", "failed", "stopped"):
+            return
+        time.sleep(0.05)
+    raise TimeoutError(f"Job did not complete in {timeout}s; status={job.status}")
+
+
+def _create_job(uploaded: Path, **kwargs):
+    from app.backend.services.job_manager import JobManager
+    from app.backend.services.model_router import RouteGroup
+
+    def fake_process_files(*args, **kw):
+        return (1, 1, False, None, {"extracted": 0, "skipped": 0, "added": 0}, None)
+
+    route_group = RouteGroup(targets=["en"], model="test-model", profile_id="general", model_type="general")
+    with patch("app.backend.services.job_manager.process_files", side_effect=fake_process_files), \
+         patch("app.backend.services.job_manager.QE_ENABLED", False), \
+         patch("app.backend.services.job_manager.config.JUDGE_ENABLED", False):
+        job = JobManager().create_job(
+            uploaded_files=[uploaded],
+            route_groups=[route_group],
+            src_lang=None,
+            include_headers=False,
+            **kwargs,
+        )
+        _wait_for_job(job)
+    return job
+
+
+def test_create_job_copies_uploads_by_default():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "document.docx"
+        src.write_bytes(b"fake content")
+
+        job = _create_job(src)
+
+        assert src.exists(), "default create_job must leave the caller's file in place"
+        assert (job.input_dir / "document.docx").read_bytes() == b"fake content"
+
+
+def test_create_job_take_ownership_moves_uploads():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "document.docx"
+        src.write_bytes(b"fake content")
+
+        job = _create_job(src, take_ownership=True)
+
+        assert not src.exists(), "take_ownership must move, not copy, the upload"
+        assert (job.input_dir / "document.docx").read_bytes() == b"fake content"
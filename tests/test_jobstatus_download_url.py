@@ -272,3 +272,20 @@ class TestDownloadEndpointUnchanged:
         )
         # Should be 200 (file served) since job has a real zip file on disk
         assert resp.status_code == 200
+
+    def test_download_endpoint_supports_range_requests(self, tmp_path):
+        """Partial downloads can resume: Range is honoured and advertised."""
+        zip_path = tmp_path / "out.zip"
+        zip_path.write_bytes(b"PK\x03\x04rest-of-archive")
+
+        job = _make_job(job_id="dl-job-2", status="completed", output_zip=zip_path)
+
+        with patch("app.backend.api.routes.job_manager") as mock_jm:
+            mock_jm.get_job.return_value = job
+            client = _get_test_client()
+            full = client.get("/api/jobs/dl-job-2/download")
+            part = client.get("/api/jobs/dl-job-2/download", headers={"Range": "bytes=4-"})
+
+        assert full.headers["accept-ranges"] == "bytes"
+        assert part.status_code == 206
+        assert part.content == b"rest-of-archive"
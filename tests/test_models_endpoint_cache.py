@@ -0,0 +1,61 @@
+"""Tests for the short per-node TTL cache behind GET /api/models.
+
+Mock boundary: the shared requests.Session (HTTP boundary) via _get_session.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+
+from app.backend.clients import ollama_client
+from app.backend.clients.ollama_client import OllamaClient, list_ollama_models
+from app.backend.config import DEFAULT_MODEL
+
+
+def _tags(*names: str) -> MagicMock:
+    resp = MagicMock(status_code=200)
+    resp.content = ('{"models": [%s]}' % ", ".join('{"name": "%s"}' % n for n in names)).encode()
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(ollama_client, "_models_cache", {})
+
+
+def test_models_served_from_cache_within_ttl():
+    from app.backend.main import app
+
+    session = MagicMock()
+    session.get.return_value = _tags("qwen3.5:9b")
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        client = TestClient(app)
+        first = client.get("/api/models")
+        second = client.get("/api/models")
+
+    assert first.json() == second.json() == {"models": ["qwen3.5:9b"]}
+    assert session.get.call_count == 1
+
+
+def test_models_refreshed_after_ttl(monkeypatch):
+    monkeypatch.setattr(ollama_client, "_MODELS_TTL_S", 0.0)
+    session = MagicMock()
+    session.get.side_effect = [_tags("a"), _tags("a", "b")]
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        list_ollama_models("http://gpu1:11434")
+        second = list_ollama_models("http://gpu1:11434/")
+
+    assert second == ["a", "b"]
+    assert session.get.call_count == 2
+
+
+def test_failed_listing_is_not_cached():
+    session = MagicMock()
+    session.get.side_effect = [requests.exceptions.ConnectionError("down"), _tags("a")]
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        assert list_ollama_models("http://gpu1:11434") == [DEFAULT_MODEL]
+        assert list_ollama_models("http://gpu1:11434") == ["a"]
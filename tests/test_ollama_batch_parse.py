@@ -0,0 +1,51 @@
+"""Tests for OllamaClient._parse_batch_response and output sanitizing.
+
+Pure-function tests: no HTTP involved.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.backend.clients.ollama_client import OllamaClient
+from app.backend.config import BATCH_SEPARATOR
+
+
+@pytest.fixture
+def client() -> OllamaClient:
+    return OllamaClient(model="qwen3.5:4b")
+
+
+def test_numbered_markers_parsed_in_index_order(client) -> None:
+    response = "<<<SEG_1>>>\nDeux\n<<<SEG_0>>>\nUn\n\n<<<SEG_2>>>\nTrois\n"
+    assert client._parse_batch_response(response, 3) == ["Un", "Deux", "Trois"]
+
+
+def test_out_of_range_markers_are_ignored(client) -> None:
+    response = "<<<SEG_0>>>\nUn\n<<<SEG_7>>>\nstray\n<<<SEG_1>>>\nDeux"
+    assert client._parse_batch_response(response, 2) == ["Un", "Deux"]
+
+
+def test_legacy_separator_fallback_strips_leaked_markers(client) -> None:
+    sep = BATCH_SEPARATOR.strip()
+    response = f"Un\n{sep}\n<<<SEG_1>>> Deux\n{sep}\nTrois"
+    assert client._parse_batch_response(response, 3) == ["Un", "Deux", "Trois"]
+
+
+def test_alternative_separator_fallback(client) -> None:
+    assert client._parse_batch_response("Un\n---\nDeux", 2) == ["Un", "Deux"]
+
+
+def test_partial_markers_returned_when_no_separator_matches(client) -> None:
+    response = "<<<SEG_0>>>\nUn\n<<<SEG_2>>>\nTrois"
+    assert client._parse_batch_response(response, 4) == ["Un", "", "Trois", ""]
+
+
+def test_sanitize_strips_markdown_artefacts_and_commentary() -> None:
+    raw = "**Bonjour** <<END>>\nNote: literal rendering\n<SEC_GEN>le monde</SEC_GEN>"
+    assert OllamaClient._sanitize_translation(raw) == "Bonjour \nle monde"
+
+
+def test_malformed_marker_ends_previous_segment_without_starting_one(client) -> None:
+    response = "<<<SEG_0>>> Un <<<SEG_x>>> junk\n<<<SEG_1>>>Deux"
+    assert client._parse_batch_response(response, 2) == ["Un", "Deux"]
@@ -0,0 +1,169 @@
+"""Tests for OllamaClient.translate_batch recovery: adaptive sizing and per-segment fallback.
+
+Mock boundary: _call_ollama (HTTP boundary) via patch.object on a real client.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from unittest.mock import patch
+
+from app.backend.clients import ollama_client
+from app.backend.clients.ollama_client import OllamaClient
+from app.backend.config import API_ATTEMPTS, DEFAULT_MAX_BATCH_CHARS
+from app.backend.utils.translation_helpers import BatchTranslator
+
+_SEG_IN_PROMPT = re.compile(r"<<<SEG_(\d+)>>>\n([^\[\n][^\n]*)")
+
+
+def _reply(payload, timeout_tuple=None):
+    segs = _SEG_IN_PROMPT.findall(payload["prompt"])
+    if not segs:
+        return True, payload["prompt"].rsplit("\n", 1)[-1].upper()
+    return True, "\n".join(f"<<<SEG_{i}>>>\n{text.upper()}" for i, text in segs)
+
+
+def test_batch_over_target_is_split_in_order() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    client._target_batch_chars = 10.0
+
+    with patch.object(client, "_call_ollama", side_effect=_reply) as mock_call:
+        ok, results = client.translate_batch(["aaaa", "bbbb", "cccc", "dddd", "ee"], "French", "English")
+
+    assert ok
+    assert results == ["AAAA", "BBBB", "CCCC", "DDDD", "EE"]
+    assert mock_call.call_count == 2
+
+
+def test_context_length_error_shrinks_target_and_retries_smaller() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    texts = ["x" * 400, "y" * 400, "z" * 400]
+
+    def _ctx_limited(payload, timeout_tuple=None):
+        if len(payload["prompt"]) > 1000:
+            return False, "HTTP 500: input length exceeds the context length"
+        return _reply(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_ctx_limited):
+        ok, results = client.translate_batch(texts, "French", "English")
+
+    assert ok
+    assert results == [t.upper() for t in texts]
+    assert client._target_batch_chars < 1200
+
+
+def test_unparseable_small_batch_falls_back_to_concurrent_single_requests() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+
+    def _garbled(payload, timeout_tuple=None):
+        if "<<<SEG_" in payload["prompt"]:
+            return True, "ALPHA and BETA run together"
+        return _reply(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_garbled) as mock_call:
+        ok, results = client.translate_batch(["alpha", "beta"], "French", "English")
+
+    assert ok
+    assert results == ["ALPHA", "BETA"]
+    assert mock_call.call_count == 3
+    assert client._target_batch_chars == DEFAULT_MAX_BATCH_CHARS
+
+
+def test_segments_missing_from_batch_reply_are_translated_individually(caplog) -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    texts = [f"seg{i}" for i in range(5)]
+    partial = "\n".join(f"<<<SEG_{i}>>>\nSEG{i}" for i in range(4))
+
+    def _partial(payload, timeout_tuple=None):
+        if "<<<SEG_" in payload["prompt"]:
+            return True, partial
+        return _reply(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_partial) as mock_call, \
+            caplog.at_level(logging.WARNING, logger="TranslateTool"):
+        ok, results = client.translate_batch(texts, "French", "English")
+
+    assert ok
+    assert results == ["SEG0", "SEG1", "SEG2", "SEG3", "SEG4"]
+    assert mock_call.call_count == 2
+    assert any("dropped 1/5 segments" in r.getMessage() for r in caplog.records)
+
+
+def test_partial_marker_parse_shrinks_target_instead_of_growing() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    texts = ["x" * 400, "y" * 400, "z" * 400, "w" * 400, "v" * 400]
+    partial = "\n".join(f"<<<SEG_{i}>>>\n{texts[i].upper()}" for i in range(4))
+
+    def _partial(payload, timeout_tuple=None):
+        if "<<<SEG_" in payload["prompt"]:
+            return True, partial
+        return _reply(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_partial):
+        ok, results = client.translate_batch(texts, "French", "English")
+
+    assert ok
+    assert results == [t.upper() for t in texts]
+    assert client._target_batch_chars < DEFAULT_MAX_BATCH_CHARS
+
+
+def test_fully_parsed_batch_grows_target_up_to_the_maximum() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    client._target_batch_chars = DEFAULT_MAX_BATCH_CHARS / 2
+
+    with patch.object(client, "_call_ollama", side_effect=_reply):
+        client.translate_batch(["alpha", "beta"], "French", "English")
+
+    assert DEFAULT_MAX_BATCH_CHARS / 2 < client._target_batch_chars <= DEFAULT_MAX_BATCH_CHARS
+
+
+def test_failed_fill_is_reported_per_segment_without_retranslating_the_batch() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    texts = ["alpha", "beta", "gamma"]
+
+    def _drops_gamma(payload, timeout_tuple=None):
+        if "<<<SEG_" in payload["prompt"]:
+            return True, "<<<SEG_0>>>\nALPHA\n<<<SEG_1>>>\nBETA"
+        if payload["prompt"].endswith("gamma"):
+            return False, "HTTP 500: boom"
+        return _reply(payload)
+
+    translator = BatchTranslator(client, tgt="French", src_lang="English")
+    with patch.object(client, "_call_ollama", side_effect=_drops_gamma) as mock_call, \
+            patch.object(ollama_client.time, "sleep"):
+        results = translator.translate_all(texts)
+
+    assert results[:2] == [(True, "ALPHA"), (True, "BETA")]
+    assert results[2] == (False, "[Translation failed|French] gamma")
+    assert mock_call.call_count == 1 + API_ATTEMPTS
+
+
+def test_cancelled_batch_sends_no_requests() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    cancel = threading.Event()
+    cancel.set()
+
+    with patch.object(client, "_call_ollama", side_effect=_reply) as mock_call:
+        outcomes = client.translate_batch_outcomes(["alpha", "beta"], "French", "English", cancel_event=cancel)
+
+    assert outcomes == [(False, "cancelled")] * 2
+    assert mock_call.call_count == 0
+
+
+def test_failed_sub_batch_does_not_fail_the_others() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    client._target_batch_chars = 10.0
+
+    def _fail_second(payload, timeout_tuple=None):
+        if "cccc" in payload["prompt"]:
+            return False, "HTTP 500: boom"
+        return _reply(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_fail_second), \
+            patch.object(ollama_client.time, "sleep"):
+        outcomes = client.translate_batch_outcomes(["aaaa", "bbbb", "cccc", "dddd"], "French", "English")
+
+    assert outcomes[:2] == [(True, "AAAA"), (True, "BBBB")]
+    assert [ok for ok, _ in outcomes[2:]] == [False, False]
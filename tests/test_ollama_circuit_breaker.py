@@ -0,0 +1,58 @@
+"""Tests for the per-endpoint Ollama circuit breaker.
+
+Mock boundary: the shared requests.Session (HTTP boundary) via _get_session.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from app.backend.clients.ollama_client import OllamaClient, _CircuitBreaker
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breakers(monkeypatch):
+    monkeypatch.setattr(OllamaClient, "_breakers", {})
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_recovery() -> None:
+    breaker = _CircuitBreaker(failure_threshold=2, recovery_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+
+    assert breaker.allow()          # recovery elapsed: one trial request
+    assert not breaker.allow()      # ...and only one
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_failed_trial_reopens_circuit() -> None:
+    breaker = _CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_open_circuit_fails_fast_without_touching_the_network() -> None:
+    client = OllamaClient(base_url="http://ollama-down:11434", model="qwen3.5:4b")
+    session = MagicMock()
+    session.post.side_effect = requests.exceptions.ConnectionError("refused")
+
+    with patch.object(OllamaClient, "_get_session", return_value=session), \
+            patch("app.backend.clients.ollama_client.time.sleep"):
+        breaker = OllamaClient._get_breaker(client.base_url)
+        for _ in range(5):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client._call_ollama({"model": "qwen3.5:4b", "prompt": "hi"})
+        assert breaker.state == "open"
+
+        posts_before = session.post.call_count
+        ok, result = client.translate_once("Hello", "French", "English")
+
+    assert not ok
+    assert result.startswith("[circuit open]")
+    assert session.post.call_count == posts_before
@@ -0,0 +1,110 @@
+"""Tests for OllamaClient._translate_chunked (long-text fallback path).
+
+Mock boundary: _call_ollama (HTTP boundary) via patch.object on a real client.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+from app.backend.clients.ollama_client import OllamaClient, _chunk_text
+
+
+def _echo(payload, timeout_tuple=None):
+    return True, payload["prompt"].rsplit("\n", 1)[-1].upper()
+
+
+def test_chunks_are_dispatched_concurrently_and_joined_in_order() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _slow_echo(payload, timeout_tuple=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return _echo(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_slow_echo):
+        ok, result = client._translate_chunked("alpha\n\nbeta\n\ngamma", "French", "English", max_chunk_chars=5)
+
+    assert ok
+    assert result == "ALPHA\n\nBETA\n\nGAMMA"
+    assert peak > 1
+
+
+def test_any_failed_chunk_fails_the_whole_text() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+
+    def _fail_beta(payload, timeout_tuple=None):
+        if payload["prompt"].endswith("beta"):
+            return False, "HTTP 500: boom"
+        return _echo(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_fail_beta):
+        ok, result = client._translate_chunked("alpha\nbeta\ngamma", "French", "English", max_chunk_chars=5)
+
+    assert not ok
+    assert "HTTP 500: boom" in result
+
+
+def test_repeated_chunks_are_translated_once() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+
+    with patch.object(client, "_call_ollama", side_effect=_echo) as mock_call:
+        ok, result = client._translate_chunked("same\nother\nsame\nsame", "French", "English", max_chunk_chars=5)
+
+    assert ok
+    assert result == "SAME\nOTHER\nSAME\nSAME"
+    assert mock_call.call_count == 2
+
+
+def test_short_chunks_are_coalesced_into_one_batch_request() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+    reply = "<<<SEG_0>>> ALPHA\n<<<SEG_1>>> BETA\n<<<SEG_2>>> GAMMA"
+
+    with patch.object(client, "_call_ollama", return_value=(True, reply)) as mock_call:
+        ok, result = client._translate_chunked("alpha\nbeta\ngamma\nbeta", "French", "English")
+
+    assert ok
+    assert result == "ALPHA\nBETA\nGAMMA\nBETA"
+    assert mock_call.call_count == 1
+
+
+def test_batch_parse_mismatch_falls_back_to_per_chunk_requests() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+
+    def _reply(payload, timeout_tuple=None):
+        if "<<<SEG_" in payload["prompt"]:
+            return True, "<<<SEG_0>>> ALPHA BETA"
+        return _echo(payload)
+
+    with patch.object(client, "_call_ollama", side_effect=_reply) as mock_call:
+        ok, result = client._translate_chunked("alpha\nbeta", "French", "English")
+
+    assert ok
+    assert result == "ALPHA\nBETA"
+    assert mock_call.call_count == 3
+
+
+def test_chunk_text_keeps_one_chunk_per_paragraph() -> None:
+    assert _chunk_text("  one \n\n\n\ntwo\n\n", 100) == (["one", "two"], "\n\n")
+
+
+def test_chunk_text_packs_sentences_up_to_the_limit() -> None:
+    chunks, joiner = _chunk_text("Aa aa. Bb bb! Cc cc? Dd dd.", 14)
+    assert joiner == " "
+    assert chunks == ["Aa aa. Bb bb!", "Cc cc? Dd dd."]
+
+
+def test_chunk_text_cuts_overlong_pieces_at_whitespace() -> None:
+    chunks, _ = _chunk_text("alpha beta gamma delta\nx", 11)
+    assert chunks == ["alpha beta", "gamma delta", "x"]
+    assert _chunk_text("一二三四五", 2)[0] == ["一二", "三四", "五"]
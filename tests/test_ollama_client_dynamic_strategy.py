@@ -158,3 +158,15 @@ def test_translate_json_no_system_prompt_or_context_omits_system_key() -> None:
 
     payload = mock_call.call_args[0][0]
     assert "system" not in payload
+
+
+def test_model_family_flag_follows_model_swaps() -> None:
+    """The translategemma flag is cached per model, not per client: callers
+    such as term extraction swap client.model on a live client."""
+    client = OllamaClient(model="translategemma:12b")
+    assert client._is_translategemma_model()
+    assert "professional" in client._build_single_translate_payload("x", "French", "English")["prompt"]
+
+    client.model = "qwen3.5:4b"
+    assert not client._is_translategemma_model()
+    assert "professional" not in client._build_single_translate_payload("x", "French", "English")["prompt"]
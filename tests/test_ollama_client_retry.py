@@ -0,0 +1,33 @@
+"""Tests for OllamaClient retry backoff.
+
+Mock boundary: _call_ollama (HTTP boundary) and time.sleep in the client module.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.backend.clients import ollama_client
+from app.backend.clients.ollama_client import OllamaClient, _next_backoff
+from app.backend.config import API_ATTEMPTS, API_BACKOFF_BASE, API_BACKOFF_CAP
+
+
+def test_next_backoff_stays_within_decorrelated_bounds() -> None:
+    prev = 0.0
+    for _ in range(50):
+        delay = _next_backoff(prev)
+        assert API_BACKOFF_BASE <= delay <= min(API_BACKOFF_CAP, max(prev, API_BACKOFF_BASE) * 3)
+        prev = delay
+    assert prev <= API_BACKOFF_CAP
+
+
+def test_batch_retry_does_not_sleep_after_final_attempt() -> None:
+    client = OllamaClient(model="qwen3.5:4b")
+
+    with patch.object(client, "_call_ollama", return_value=(False, "HTTP 500: boom")), \
+            patch.object(ollama_client.time, "sleep") as mock_sleep:
+        ok, results = client.translate_batch(["a", "b"], "French", "English")
+
+    assert not ok
+    assert results == ["HTTP 500: boom"] * 2
+    assert mock_sleep.call_count == API_ATTEMPTS - 1
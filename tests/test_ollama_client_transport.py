@@ -0,0 +1,156 @@
+"""Tests for OllamaClient's /api/generate transport: wire format and endpoint routing.
+
+Mock boundary: the shared requests.Session (HTTP boundary) via _get_session.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from app.backend.clients.ollama_client import OllamaClient, _EndpointStats
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breakers(monkeypatch):
+    monkeypatch.setattr(OllamaClient, "_breakers", {})
+    monkeypatch.setattr(OllamaClient, "_endpoint_stats", {})
+
+
+def _stream_response(*chunks: dict) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.iter_lines.return_value = [json.dumps(c, ensure_ascii=False).encode("utf-8") for c in chunks]
+    return resp
+
+
+def test_payload_sent_as_utf8_json_bytes_and_stream_reassembled() -> None:
+    client = OllamaClient(model="qwen3.5:4b", fallback_urls=[])
+    session = MagicMock()
+    session.post.return_value = _stream_response(
+        {"response": "<think>hmm</think>Bon", "done": False},
+        {"response": "jour", "done": True},
+        {"response": "ignored after done"},
+    )
+
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        ok, result = client._call_ollama({"model": "qwen3.5:4b", "prompt": "你好"})
+
+    assert (ok, result) == (True, "Bonjour")
+    kwargs = session.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert "json" not in kwargs
+    sent = json.loads(kwargs["data"])
+    assert sent == {"model": "qwen3.5:4b", "prompt": "你好", "stream": True}
+
+
+def test_generate_fails_over_to_next_endpoint_when_one_is_unreachable() -> None:
+    client = OllamaClient(base_url="http://gpu1:11434", model="qwen3.5:4b", fallback_urls=["http://gpu2:11434/"])
+    session = MagicMock()
+    session.post.side_effect = [
+        requests.exceptions.ConnectionError("refused"),
+        _stream_response({"response": "Hello", "done": True}),
+    ]
+
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        ok, result = client._call_ollama({"model": "qwen3.5:4b", "prompt": "你好"})
+
+    assert (ok, result) == (True, "Hello")
+    urls = [c.args[0] for c in session.post.call_args_list]
+    assert urls == ["http://gpu1:11434/api/generate", "http://gpu2:11434/api/generate"]
+    assert OllamaClient._get_endpoint_stats("http://gpu2:11434").in_flight == 0
+
+
+def test_generate_prefers_endpoint_with_lower_recent_latency() -> None:
+    client = OllamaClient(base_url="http://gpu1:11434", model="qwen3.5:4b", fallback_urls=["http://gpu2:11434"])
+    OllamaClient._get_endpoint_stats("http://gpu1:11434").observe(4.0)
+    OllamaClient._get_endpoint_stats("http://gpu2:11434").observe(0.5)
+    session = MagicMock()
+    session.post.return_value = _stream_response({"response": "Hello", "done": True})
+
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        client._call_ollama({"model": "qwen3.5:4b", "prompt": "你好"})
+
+    assert session.post.call_args.args[0] == "http://gpu2:11434/api/generate"
+
+
+def test_concurrency_limit_halves_on_failure_and_recovers_additively() -> None:
+    stats = _EndpointStats(max_limit=4)
+
+    stats.record_outcome(False)
+    stats.record_outcome(False)
+    assert stats.limit == 1
+
+    stats.record_outcome(True)
+    assert stats.limit == 2
+    for _ in range(2 + 3):
+        stats.record_outcome(True)
+    assert stats.limit == 4
+    for _ in range(10):
+        stats.record_outcome(True)
+    assert stats.limit == 4
+
+
+def test_server_error_lowers_endpoint_concurrency_limit() -> None:
+    client = OllamaClient(model="qwen3.5:4b", fallback_urls=[])
+    session = MagicMock()
+    session.post.return_value = MagicMock(status_code=503, text="overloaded")
+
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        ok, _ = client._call_ollama({"model": "qwen3.5:4b", "prompt": "你好"})
+
+    stats = OllamaClient._get_endpoint_stats(client.base_url)
+    assert not ok
+    assert stats.limit < _EndpointStats().limit
+    assert stats.in_flight == 0
+
+
+def test_health_check_passes_when_a_fallback_endpoint_answers() -> None:
+    client = OllamaClient(base_url="http://gpu1:11434", model="qwen3.5:4b", fallback_urls=["http://gpu2:11434"])
+    session = MagicMock()
+    session.get.side_effect = [
+        requests.exceptions.ConnectionError("refused"),
+        MagicMock(status_code=200, content=b'{"models": [{"name": "qwen3.5:4b"}]}'),
+    ]
+
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        ok, msg = client.health_check()
+
+    assert ok
+    assert "via http://gpu2:11434" in msg
+    assert [c.args[0] for c in session.get.call_args_list] == [
+        "http://gpu1:11434/api/tags", "http://gpu2:11434/api/tags",
+    ]
+
+
+def test_health_check_skips_endpoints_with_an_open_circuit() -> None:
+    client = OllamaClient(base_url="http://gpu1:11434", model="qwen3.5:4b", fallback_urls=["http://gpu2:11434"])
+    breaker = OllamaClient._get_breaker("http://gpu1:11434")
+    for _ in range(10):
+        breaker.record_failure()
+    session = MagicMock()
+    session.get.return_value = MagicMock(status_code=200, content=b'{"models": []}')
+
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        ok, _ = client.health_check()
+
+    assert ok
+    assert [c.args[0] for c in session.get.call_args_list] == ["http://gpu2:11434/api/tags"]
+
+
+def test_unload_model_reaches_every_endpoint() -> None:
+    client = OllamaClient(base_url="http://gpu1:11434", model="qwen3.5:4b", fallback_urls=["http://gpu2:11434"])
+    session = MagicMock()
+    session.post.return_value = MagicMock(status_code=200)
+
+    with patch.object(OllamaClient, "_get_session", return_value=session):
+        ok, _ = client.unload_model()
+
+    assert ok
+    assert [c.args[0] for c in session.post.call_args_list] == [
+        "http://gpu1:11434/api/generate", "http://gpu2:11434/api/generate",
+    ]
+    assert json.loads(session.post.call_args.kwargs["data"])["keep_alive"] == 0
@@ -153,6 +153,16 @@ class TestPyMuPDFParserIntegration:
         for elem in headers + footers:
             assert elem.should_translate is False
 
+    def test_font_names_shared_across_elements(self, parser, test_pdf_path):
+        """Elements set in the same font share one interned font-name string."""
+        doc = parser.parse(test_pdf_path)
+
+        fonts: dict = {}
+        for elem in doc.elements:
+            if elem.style is not None:
+                name = elem.style.font_name
+                assert fonts.setdefault(name, name) is name
+
 
 class TestTableDetection:
     """Tests for table detection functionality."""
@@ -250,6 +260,44 @@ class TestTableDetection:
         assert elements[1].element_type == ElementType.TEXT
 
 
+class TestMarkPageTables:
+    """Per-page table marking fused into the extraction pass."""
+
+    def test_each_table_marks_only_elements_within_its_span(self):
+        """Two stacked tables: each marks its own elements; others are untouched."""
+        from app.backend.models.translatable_document import (
+            BoundingBox,
+            ElementType,
+            TranslatableElement,
+        )
+        from app.backend.parsers.pdf_parser import PyMuPDFParser
+
+        parser = PyMuPDFParser.__new__(PyMuPDFParser)
+        top, bottom = MagicMock(bbox=(100, 100, 300, 200)), MagicMock(bbox=(100, 400, 300, 500))
+        top.cells = bottom.cells = []
+        page = MagicMock()
+        page.find_tables.return_value = MagicMock(tables=[top, bottom])
+
+        def elem(eid, y0):
+            return TranslatableElement(
+                element_id=eid,
+                content=eid,
+                element_type=ElementType.TEXT,
+                page_num=3,
+                bbox=BoundingBox(x0=110, y0=y0, x1=200, y1=y0 + 20),
+            )
+
+        elems = [elem("in_bottom", 420), elem("between", 300), elem("in_top", 120), elem("no_bbox", 0)]
+        elems[-1].bbox = None
+
+        rebuilt, counter = parser._mark_page_tables(page, 3, elems, 7)
+
+        assert rebuilt is None
+        assert counter == 9
+        assert [e.metadata.get("table_id") for e in elems] == ["p3_t8", None, "p3_t7", None]
+        assert elems[1].element_type == ElementType.TEXT
+
+
 class TestTableDetectionStrategyFallback:
     """BR-101 (AC-4/AC-7): additive, sanity-gated looser-strategy find_tables() fallback."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -9,7 +10,7 @@ import pptx
 import pytest
 
 from app.backend.models.translatable_document import ElementType
-from app.backend.parsers.pptx_parser import PptxParser
+from app.backend.parsers.pptx_parser import PptxParser, resolve_shape
 
 
 class TestPptxParser:
@@ -159,6 +160,30 @@ class TestPptxParser:
         assert "Cell A1" in contents
         assert "Cell B2" in contents
 
+    def test_shape_path_resolves_to_source_shape(self, parser, simple_pptx, table_pptx):
+        """metadata["shape_path"] locates the shape/cell without a live reference."""
+        for path in (simple_pptx, table_pptx):
+            doc = parser.parse(path)
+            json.dumps(doc.to_dict())
+            prs = pptx.Presentation(path)
+            for elem in doc.elements:
+                shape = resolve_shape(prs, elem.metadata["shape_path"])
+                if elem.metadata.get("in_table"):
+                    cell = shape.table.cell(elem.metadata["row"] - 1, elem.metadata["col"] - 1)
+                    assert cell.text.strip() == elem.content
+                else:
+                    assert elem.content in shape.text_frame.text
+
+    def test_text_frame_text_matches_python_pptx(self, parser):
+        """Paragraphs join with newlines; soft line breaks stay as vertical tabs."""
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        tf = slide.shapes.add_textbox(0, 0, 100, 100).text_frame
+        tf.text = "Line one\vstill one"
+        tf.add_paragraph().text = "Line two"
+
+        assert parser._get_text_frame_text(tf) == tf.text == "Line one\vstill one\nLine two"
+
     def test_title_classification(self, parser, simple_pptx):
         """Test that title placeholders are classified as TITLE."""
         doc = parser.parse(simple_pptx)
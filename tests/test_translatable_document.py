@@ -44,6 +44,14 @@ class TestBoundingBox:
         assert bbox.x1 == 110
         assert bbox.y1 == 70
 
+    def test_slotted_instances_have_no_dict(self):
+        """Model instances are slotted: no per-instance __dict__, no stray attributes."""
+        bbox = BoundingBox(x0=10, y0=20, x1=110, y1=70)
+
+        assert not hasattr(bbox, "__dict__")
+        with pytest.raises(AttributeError):
+            bbox.x2 = 0  # type: ignore[attr-defined]
+
     def test_from_tuple(self):
         """Test creation from tuple."""
         bbox = BoundingBox.from_tuple((10, 20, 110, 70))
@@ -292,6 +300,36 @@ class TestTranslatableDocument:
                     assert key >= prev_key
                 prev_key = key
 
+    def test_explicit_reading_order_precedes_positional_fallback(self):
+        """Elements with reading_order come first (by index), then the rest by position."""
+
+        def elem(eid, page, y0, ro=None):
+            return TranslatableElement(
+                element_id=eid,
+                content=eid,
+                element_type=ElementType.TEXT,
+                page_num=page,
+                bbox=BoundingBox(x0=0, y0=y0, x1=10, y1=y0 + 10),
+                reading_order=ro,
+            )
+
+        doc = TranslatableDocument(
+            source_path="/tmp/test.pdf",
+            source_type="pdf",
+            elements=[
+                elem("p2_top", 2, 10),
+                elem("ro1", 2, 500, ro=1),
+                elem("p1_low", 1, 300),
+                elem("ro0", 1, 900, ro=0),
+                elem("p1_high", 1, 50),
+            ],
+            pages=[],
+            metadata=DocumentMetadata(page_count=2),
+        )
+
+        ordered = [e.element_id for e in doc.get_elements_in_reading_order()]
+        assert ordered == ["ro0", "ro1", "p1_high", "p1_low", "p2_top"]
+
     def test_get_unique_texts(self, sample_document):
         """Test deduplication of text content."""
         unique = sample_document.get_unique_texts()
@@ -318,6 +356,17 @@ class TestTranslatableDocument:
                 if original in translations:
                     assert elem.translated_content == translations[original]
 
+    def test_apply_translations_follows_reassigned_content(self, sample_document):
+        """The memoised stripped content is refreshed when content changes."""
+        elem = sample_document.get_translatable_elements()[0]
+        elem.content = "  Before  "
+        sample_document.apply_translations({"Before": "之前"})
+        assert elem.translated_content == "之前"
+
+        elem.content = "After\n"
+        sample_document.apply_translations({"After": "之後"})
+        assert elem.translated_content == "之後"
+
     def test_roundtrip(self, sample_document):
         """Test serialization roundtrip."""
         data = sample_document.to_dict()
@@ -1,4 +1,5 @@
-"""Tests for TranslationCache, specifically purge_empty() (cache-poisoning repair).
+"""Tests for TranslationCache: purge_empty() (cache-poisoning repair) and the
+per-thread connection pool.
 
 Mock seam: none — uses a real SQLite file under tmp_path (fast, no I/O contention
 with the app's real cache).
@@ -77,3 +78,161 @@ def test_purged_entry_is_retranslated_on_next_get_batch_miss(cache):
     cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "xin chao")
     fixed = cache.get_batch(["hello"], "Vietnamese", "en", "panjit/gpt-oss:120b")
     assert fixed["hello"] == "xin chao"
+
+
+def test_connection_is_reused_per_thread(cache):
+    assert cache._get_conn() is cache._get_conn()
+
+
+def test_close_closes_connections_from_all_threads(cache):
+    import threading
+
+    worker_conns = []
+
+    def _worker():
+        worker_conns.append(cache._get_conn())
+
+    t = threading.Thread(target=_worker)
+    t.start()
+    t.join()
+
+    cache.close()
+
+    for conn in worker_conns:
+        with pytest.raises(Exception):
+            conn.execute("SELECT 1")
+
+
+def test_cache_reopens_transparently_after_close(cache):
+    cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "xin chao")
+    cache.close()
+
+    remaining = cache.get_batch(["hello"], "Vietnamese", "en", "panjit/gpt-oss:120b")
+    assert remaining["hello"] == "xin chao"
+
+
+def test_connection_pragmas_applied(cache):
+    conn = cache._get_conn()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+    assert conn.execute("PRAGMA page_size").fetchone()[0] == 32768
+
+
+def test_get_batch_is_read_only(cache):
+    """Cache hits must not turn the read path into a write path (no per-hit
+    recency UPDATE/COMMIT)."""
+    cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "xin chao")
+    conn = cache._get_conn()
+    before = conn.total_changes
+
+    for _ in range(3):
+        cache.get_batch(["hello", "missing"], "Vietnamese", "en", "panjit/gpt-oss:120b")
+
+    assert conn.total_changes == before
+    assert not conn.in_transaction
+
+
+def test_stats_entry_count_tracks_writes(cache):
+    cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "")
+    cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "dup ignored")
+    cache.put_batch([
+        ("a", "Vietnamese", "en", "ollama/qwen3.5:9b", "a-vi"),
+        ("b", "Vietnamese", "en", "ollama/qwen3.5:9b", "b-vi"),
+    ])
+    assert cache.stats()["entries"] == 3
+
+    cache.purge_empty()
+    assert cache.stats()["entries"] == 2
+
+    cache.clear(model="ollama/qwen3.5:9b")
+    assert cache.stats()["entries"] == 0
+
+
+def test_stats_entry_count_seeded_from_existing_file(tmp_path):
+    db = tmp_path / "seeded.db"
+    first = TranslationCache(db_path=db)
+    first.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "xin chao")
+    first.close()
+
+    assert TranslationCache(db_path=db).stats()["entries"] == 1
+
+
+def test_put_truncates_wal_once_checkpoint_interval_elapsed(cache, monkeypatch):
+    from app.backend.services import translation_cache as tc
+
+    wal = cache._db_path.with_name(cache._db_path.name + "-wal")
+    cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "xin chao")
+    assert wal.stat().st_size > 0
+
+    monkeypatch.setattr(tc, "_WAL_CHECKPOINT_INTERVAL_S", 0)
+    cache.put("world", "Vietnamese", "en", "panjit/gpt-oss:120b", "the gioi")
+
+    assert wal.stat().st_size == 0
+
+
+def test_v1_hex_key_file_is_migrated_without_losing_entries(tmp_path):
+    import hashlib
+    import sqlite3
+
+    db = tmp_path / "v1.db"
+    conn = sqlite3.connect(str(db))
+    conn.execute("""
+        CREATE TABLE translations (
+            key_hash TEXT PRIMARY KEY, source_text TEXT NOT NULL, target_lang TEXT NOT NULL,
+            src_lang TEXT NOT NULL, model TEXT NOT NULL, translation TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+    conn.execute("CREATE TABLE cache_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    conn.execute("INSERT INTO cache_meta VALUES ('schema_version', '1')")
+    v1_key = hashlib.sha256("\x00".join(["hello", "vietnamese", "en", "m"]).encode()).hexdigest()
+    conn.execute(
+        "INSERT INTO translations VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (v1_key, "hello", "Vietnamese", "en", "m", "xin chao", 0.0),
+    )
+    conn.commit()
+    conn.close()
+
+    cache = TranslationCache(db_path=db)
+
+    assert cache.get_batch(["hello"], "Vietnamese", "en", "m") == {"hello": "xin chao"}
+    meta = cache._get_conn().execute(
+        "SELECT value FROM cache_meta WHERE key = 'schema_version'"
+    ).fetchone()
+    assert meta[0] == "2"
+
+
+def test_memory_lru_serves_repeat_lookups_without_sqlite(cache):
+    cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "xin chao")
+    statements = []
+    cache._get_conn().set_trace_callback(statements.append)
+
+    hits = cache.get_batch(["hello"], "Vietnamese", "en", "panjit/gpt-oss:120b")
+
+    assert hits == {"hello": "xin chao"}
+    assert statements == []
+
+
+def test_memory_lru_never_shadows_ignored_duplicate(tmp_path):
+    db = tmp_path / "dup.db"
+    TranslationCache(db_path=db).put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "")
+
+    cache = TranslationCache(db_path=db)
+    cache.put("hello", "Vietnamese", "en", "panjit/gpt-oss:120b", "xin chao")
+
+    hits = cache.get_batch(["hello"], "Vietnamese", "en", "panjit/gpt-oss:120b")
+    assert hits == {"hello": ""}
+
+
+def test_memory_lru_is_bounded_and_dropped_on_purge(tmp_path):
+    cache = TranslationCache(db_path=tmp_path / "lru.db", memory_entries=2)
+    for text in ("a", "b", "c"):
+        cache.put(text, "Vietnamese", "en", "panjit/gpt-oss:120b", "")
+    assert len(cache._memory) == 2
+
+    cache.purge_empty()
+
+    assert len(cache._memory) == 0
+    assert cache.get_batch(["a", "b", "c"], "Vietnamese", "en", "panjit/gpt-oss:120b") == {}